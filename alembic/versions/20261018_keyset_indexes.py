@@ -0,0 +1,56 @@
+"""extend list indexes with the keyset pagination tie-breaker
+
+Revision ID: 20261018_keyset_indexes
+Revises: 20261018_slot_indexes
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_keyset_indexes"
+down_revision = "20261018_slot_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_schedule_slots_available_provider_starts_at_id",
+        "schedule_slots",
+        ["provider_id", "starts_at", "id"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.create_index(
+        "ix_schedule_slots_available_starts_at_id",
+        "schedule_slots",
+        ["starts_at", "id"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.drop_index("ix_schedule_slots_available_starts_at", table_name="schedule_slots")
+    op.drop_index("ix_schedule_slots_available_provider_starts_at", table_name="schedule_slots")
+    op.create_index("ix_services_provider_id_title_id", "services", ["provider_id", "title", "id"])
+    op.create_index("ix_services_title_id", "services", ["title", "id"])
+    op.drop_index("ix_services_provider_id", table_name="services")
+
+
+def downgrade() -> None:
+    op.create_index("ix_services_provider_id", "services", ["provider_id"])
+    op.drop_index("ix_services_title_id", table_name="services")
+    op.drop_index("ix_services_provider_id_title_id", table_name="services")
+    op.create_index(
+        "ix_schedule_slots_available_provider_starts_at",
+        "schedule_slots",
+        ["provider_id", "starts_at"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.create_index(
+        "ix_schedule_slots_available_starts_at",
+        "schedule_slots",
+        ["starts_at"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.drop_index("ix_schedule_slots_available_starts_at_id", table_name="schedule_slots")
+    op.drop_index("ix_schedule_slots_available_provider_starts_at_id", table_name="schedule_slots")
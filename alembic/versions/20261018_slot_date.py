@@ -0,0 +1,46 @@
+"""stored UTC day bucket for schedule slots
+
+Revision ID: 20261018_slot_date
+Revises: 20261018_keyset_indexes
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_slot_date"
+down_revision = "20261018_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "schedule_slots",
+        sa.Column(
+            "slot_date",
+            sa.Date(),
+            sa.Computed("(starts_at AT TIME ZONE 'UTC')::date", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_schedule_slots_available_provider_date",
+        "schedule_slots",
+        ["provider_id", "slot_date", "starts_at", "id"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.create_index(
+        "ix_schedule_slots_available_date",
+        "schedule_slots",
+        ["slot_date", "starts_at", "id"],
+        postgresql_where=sa.text("is_available"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_slots_available_date", table_name="schedule_slots")
+    op.drop_index("ix_schedule_slots_available_provider_date", table_name="schedule_slots")
+    op.drop_column("schedule_slots", "slot_date")
@@ -0,0 +1,44 @@
+"""indexes for slot availability and appointment lookups
+
+Revision ID: 20261018_slot_indexes
+Revises: 20240101_init
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_slot_indexes"
+down_revision = "20240101_init"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_schedule_slots_available_provider_starts_at",
+        "schedule_slots",
+        ["provider_id", "starts_at"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.create_index(
+        "ix_schedule_slots_available_starts_at",
+        "schedule_slots",
+        ["starts_at"],
+        postgresql_where=sa.text("is_available"),
+    )
+    op.create_index("ix_services_provider_id", "services", ["provider_id"])
+    op.create_index("ix_appointments_client_id", "appointments", ["client_id"])
+    op.create_index("ix_appointments_provider_id", "appointments", ["provider_id"])
+    op.create_index("ix_appointments_slot_id", "appointments", ["slot_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_appointments_slot_id", table_name="appointments")
+    op.drop_index("ix_appointments_provider_id", table_name="appointments")
+    op.drop_index("ix_appointments_client_id", table_name="appointments")
+    op.drop_index("ix_services_provider_id", table_name="services")
+    op.drop_index("ix_schedule_slots_available_starts_at", table_name="schedule_slots")
+    op.drop_index("ix_schedule_slots_available_provider_starts_at", table_name="schedule_slots")
@@ -0,0 +1,45 @@
+"""tstzrange period and per-provider overlap exclusion for schedule slots
+
+Revision ID: 20261018_slot_period
+Revises: 20261018_slot_date
+Create Date: 2026-10-18
+
+Fails if a provider already has overlapping slots; resolve those before upgrading.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_slot_period"
+down_revision = "20261018_slot_date"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.add_column(
+        "schedule_slots",
+        sa.Column(
+            "period",
+            postgresql.TSTZRANGE(),
+            sa.Computed("tstzrange(starts_at, ends_at, '[)')", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_exclude_constraint(
+        "excl_schedule_slots_provider_period",
+        "schedule_slots",
+        ("provider_id", "="),
+        ("period", "&&"),
+        using="gist",
+    )
+
+
+def downgrade() -> None:
+    # btree_gist stays installed: other objects in the database may rely on it.
+    op.drop_constraint("excl_schedule_slots_provider_period", "schedule_slots", type_="exclude")
+    op.drop_column("schedule_slots", "period")
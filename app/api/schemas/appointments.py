@@ -1,7 +1,9 @@
+from datetime import date
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
+from app.application.schedules.service import MAX_RANGE_DAYS
 from app.domain.appointments.entities import AppointmentStatus
 
 
@@ -12,6 +14,39 @@ class AppointmentCreate(BaseModel):
     slot_id: UUID
 
 
+MAX_BATCH_SLOTS = 50
+MAX_BULK_CANCEL = 1000
+
+
+class AppointmentBatchCreate(BaseModel):
+    client_id: UUID
+    provider_id: UUID
+    service_id: UUID
+    slot_ids: list[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_SLOTS)
+
+
+class AppointmentBulkCancel(BaseModel):
+    provider_id: UUID | None = None
+    date_from: date | None = None
+    date_to: date | None = None
+    appointment_ids: list[UUID] | None = Field(None, min_length=1, max_length=MAX_BULK_CANCEL)
+
+    @model_validator(mode="after")
+    def _check_scope(self) -> "AppointmentBulkCancel":
+        by_range = self.provider_id is not None or self.date_from is not None or self.date_to is not None
+        if self.appointment_ids is not None:
+            if by_range:
+                raise ValueError("pass either appointment_ids or provider_id with a date range, not both")
+            return self
+        if self.provider_id is None or self.date_from is None or self.date_to is None:
+            raise ValueError("provider_id, date_from and date_to are required without appointment_ids")
+        if self.date_to < self.date_from:
+            raise ValueError("date_to must not be before date_from")
+        if (self.date_to - self.date_from).days >= MAX_RANGE_DAYS:
+            raise ValueError(f"date range must not exceed {MAX_RANGE_DAYS} days")
+        return self
+
+
 class AppointmentResponse(BaseModel):
     id: UUID
     client_id: UUID
@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import date, datetime, time
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class SlotCreate(BaseModel):
@@ -11,9 +12,53 @@ class SlotCreate(BaseModel):
 
 
 class SlotResponse(BaseModel):
+    # Built straight from domain entities, without a dict in between.
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     provider_id: UUID
     starts_at: datetime
     ends_at: datetime
     is_available: bool
 
+
+class SlotTemplate(BaseModel):
+    provider_id: UUID
+    date_from: date
+    date_to: date
+    weekdays: list[int] = Field(..., min_length=1, description="Days of week, Monday is 0")
+    day_start: time
+    day_end: time
+    slot_minutes: int = Field(..., gt=0, le=24 * 60)
+    exceptions: list[date] = Field(default_factory=list, description="Dates to skip")
+    timezone: str = Field("UTC", description="IANA zone the working hours are given in")
+
+    @field_validator("weekdays")
+    @classmethod
+    def _check_weekdays(cls, value: list[int]) -> list[int]:
+        if any(day not in range(7) for day in value):
+            raise ValueError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+        return value
+
+    @field_validator("timezone")
+    @classmethod
+    def _check_timezone(cls, value: str) -> str:
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"unknown timezone {value!r}") from None
+        return value
+
+    @model_validator(mode="after")
+    def _check_ranges(self) -> "SlotTemplate":
+        if self.date_to < self.date_from:
+            raise ValueError("date_to must not be before date_from")
+        if (self.date_to - self.date_from).days >= 366:
+            raise ValueError("date range must not exceed a year")
+        if self.day_end <= self.day_start:
+            raise ValueError("day_end must be after day_start")
+        return self
+
+
+class SlotBulkResponse(BaseModel):
+    created: int
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ServiceCreate(BaseModel):
@@ -11,6 +11,9 @@ class ServiceCreate(BaseModel):
 
 
 class ServiceResponse(BaseModel):
+    # Built straight from domain entities, without a dict in between.
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     provider_id: UUID
     title: str
@@ -3,11 +3,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas.appointments import AppointmentCreate, AppointmentResponse
+from app.api.schemas.appointments import (
+    AppointmentBatchCreate,
+    AppointmentBulkCancel,
+    AppointmentCreate,
+    AppointmentResponse,
+)
 from app.application.appointments.service import AppointmentService
-from app.core.dependencies import get_cache, get_db_session, get_publisher
-from app.infrastructure.cache.redis_cache import RedisCache
-from app.infrastructure.mq.publisher import EventPublisher
+from app.application.interfaces.cache import CacheProvider
+from app.application.interfaces.mq import EventPublisher
+from app.application.interfaces.repositories import OutboxRepository
+from app.core.dependencies import get_cache, get_db_session, get_outbox, get_publisher
 from app.infrastructure.repositories.appointments import SqlAlchemyAppointmentRepository
 from app.infrastructure.repositories.schedules import SqlAlchemyScheduleRepository
 
@@ -18,8 +24,9 @@ router = APIRouter()
 async def create_appointment(
     payload: AppointmentCreate,
     session: AsyncSession = Depends(get_db_session),
-    cache: RedisCache = Depends(get_cache),
+    cache: CacheProvider = Depends(get_cache),
     publisher: EventPublisher = Depends(get_publisher),
+    outbox: OutboxRepository | None = Depends(get_outbox),
 ) -> AppointmentResponse:
     service = AppointmentService(
         appointment_repo=SqlAlchemyAppointmentRepository(session),
@@ -27,6 +34,7 @@ async def create_appointment(
         cache=cache,
         publisher=publisher,
         session=session,
+        outbox=outbox,
     )
     try:
         appointment = await service.create_appointment(
@@ -40,12 +48,69 @@ async def create_appointment(
     return AppointmentResponse.model_validate(appointment.model_dump())
 
 
+@router.post("/batch", response_model=list[AppointmentResponse], status_code=status.HTTP_201_CREATED)
+async def create_appointments_batch(
+    payload: AppointmentBatchCreate,
+    session: AsyncSession = Depends(get_db_session),
+    cache: CacheProvider = Depends(get_cache),
+    publisher: EventPublisher = Depends(get_publisher),
+    outbox: OutboxRepository | None = Depends(get_outbox),
+) -> list[AppointmentResponse]:
+    service = AppointmentService(
+        appointment_repo=SqlAlchemyAppointmentRepository(session),
+        schedule_repo=SqlAlchemyScheduleRepository(session),
+        cache=cache,
+        publisher=publisher,
+        session=session,
+        outbox=outbox,
+    )
+    try:
+        appointments = await service.create_appointments_batch(
+            client_id=payload.client_id,
+            provider_id=payload.provider_id,
+            service_id=payload.service_id,
+            slot_ids=payload.slot_ids,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return [AppointmentResponse.model_validate(appointment.model_dump()) for appointment in appointments]
+
+
+@router.post("/cancel-bulk", response_model=list[AppointmentResponse])
+async def cancel_appointments_bulk(
+    payload: AppointmentBulkCancel,
+    session: AsyncSession = Depends(get_db_session),
+    cache: CacheProvider = Depends(get_cache),
+    publisher: EventPublisher = Depends(get_publisher),
+    outbox: OutboxRepository | None = Depends(get_outbox),
+) -> list[AppointmentResponse]:
+    service = AppointmentService(
+        appointment_repo=SqlAlchemyAppointmentRepository(session),
+        schedule_repo=SqlAlchemyScheduleRepository(session),
+        cache=cache,
+        publisher=publisher,
+        session=session,
+        outbox=outbox,
+    )
+    try:
+        appointments = await service.cancel_appointments_bulk(
+            provider_id=payload.provider_id,
+            date_from=payload.date_from,
+            date_to=payload.date_to,
+            appointment_ids=payload.appointment_ids,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return [AppointmentResponse.model_validate(appointment.model_dump()) for appointment in appointments]
+
+
 @router.post("/{appointment_id}/cancel", response_model=AppointmentResponse)
 async def cancel_appointment(
     appointment_id: UUID,
     session: AsyncSession = Depends(get_db_session),
-    cache: RedisCache = Depends(get_cache),
+    cache: CacheProvider = Depends(get_cache),
     publisher: EventPublisher = Depends(get_publisher),
+    outbox: OutboxRepository | None = Depends(get_outbox),
 ) -> AppointmentResponse:
     service = AppointmentService(
         appointment_repo=SqlAlchemyAppointmentRepository(session),
@@ -53,6 +118,7 @@ async def cancel_appointment(
         cache=cache,
         publisher=publisher,
         session=session,
+        outbox=outbox,
     )
     try:
         appointment = await service.cancel_appointment(appointment_id)
@@ -1,49 +1,131 @@
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from uuid import UUID
+from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas.schedules import SlotCreate, SlotResponse
-from app.application.schedules.service import ScheduleService
-from app.core.dependencies import get_cache, get_db_session
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.api.schemas.pagination import Page, decode_cursor, encode_cursor
+from app.api.schemas.schedules import SlotBulkResponse, SlotCreate, SlotResponse, SlotTemplate
+from app.application.interfaces.cache import CacheProvider
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, SlotCursor
+from app.application.schedules.recurrence import expand_recurrence
+from app.application.schedules.service import MAX_RANGE_DAYS, ScheduleService
+from app.application.single_flight import SingleFlight
+from app.core.dependencies import (
+    get_cache,
+    get_db_session,
+    get_read_session,
+    get_single_flight,
+    repository_scope,
+)
 from app.infrastructure.repositories.schedules import SqlAlchemyScheduleRepository
 
 router = APIRouter()
 
 
+def _parse_day(value: str, name: str) -> date:
+    """Slots are bucketed by UTC day: datetimes with an offset are converted, naive ones are taken as UTC."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"{name} must be ISO date or datetime") from None
+    return parsed.astimezone(UTC).date() if parsed.tzinfo else parsed.date()
+
+
 @router.post("/slots", response_model=SlotResponse, status_code=status.HTTP_201_CREATED)
 async def create_slot(
     payload: SlotCreate,
     session: AsyncSession = Depends(get_db_session),
-    cache: RedisCache = Depends(get_cache),
+    cache: CacheProvider = Depends(get_cache),
 ) -> SlotResponse:
     service = ScheduleService(repo=SqlAlchemyScheduleRepository(session), cache=cache, session=session)
-    slot = await service.create_slot(
-        provider_id=payload.provider_id, starts_at=payload.starts_at, ends_at=payload.ends_at
-    )
-    return SlotResponse.model_validate(slot.model_dump())
+    try:
+        slot = await service.create_slot(
+            provider_id=payload.provider_id, starts_at=payload.starts_at, ends_at=payload.ends_at
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return SlotResponse.model_validate(slot)
+
+
+@router.post("/slots/bulk", response_model=SlotBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_slots_bulk(
+    payload: SlotTemplate,
+    session: AsyncSession = Depends(get_db_session),
+    cache: CacheProvider = Depends(get_cache),
+) -> SlotBulkResponse:
+    try:
+        windows = expand_recurrence(
+            payload.date_from,
+            payload.date_to,
+            set(payload.weekdays),
+            payload.day_start,
+            payload.day_end,
+            payload.slot_minutes,
+            set(payload.exceptions),
+            ZoneInfo(payload.timezone),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    service = ScheduleService(repo=SqlAlchemyScheduleRepository(session), cache=cache, session=session)
+    try:
+        slots = await service.create_slots_bulk(payload.provider_id, windows)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return SlotBulkResponse(created=len(slots))
 
 
-@router.get("/slots", response_model=list[SlotResponse])
+@router.get("/slots", response_model=Page[SlotResponse])
 async def list_slots(
     provider_id: UUID | None = Query(None),
-    day: str | None = Query(None, description="Filter by date (YYYY-MM-DD or ISO datetime)"),
-    session: AsyncSession = Depends(get_db_session),
-    cache: RedisCache = Depends(get_cache),
-) -> list[SlotResponse]:
-    parsed_day: date | None = None
+    day: str | None = Query(None, description="Filter by UTC date (YYYY-MM-DD or ISO datetime)"),
+    date_from: str | None = Query(None, alias="from", description="First UTC date of a range, inclusive"),
+    date_to: str | None = Query(None, alias="to", description="Last UTC date of a range, inclusive"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_read_session),
+    cache: CacheProvider = Depends(get_cache),
+    single_flight: SingleFlight = Depends(get_single_flight),
+) -> Page[SlotResponse]:
+    if day and (date_from or date_to):
+        raise HTTPException(status_code=422, detail="day cannot be combined with from/to")
+    if bool(date_from) != bool(date_to):
+        raise HTTPException(status_code=422, detail="from and to must be given together")
+    day_range: tuple[date, date] | None = None
     if day:
+        parsed_day = _parse_day(day, "day")
+        day_range = (parsed_day, parsed_day)
+    elif date_from and date_to:
+        day_range = (_parse_day(date_from, "from"), _parse_day(date_to, "to"))
+        if not 0 <= (day_range[1] - day_range[0]).days < MAX_RANGE_DAYS:
+            raise HTTPException(status_code=422, detail=f"from..to must span 1 to {MAX_RANGE_DAYS} days")
+    after: SlotCursor | None = None
+    if cursor:
+        starts_at, slot_id = decode_cursor(cursor, 2)
         try:
-            parsed_day = date.fromisoformat(day)
+            after = (datetime.fromisoformat(starts_at), UUID(slot_id))
         except ValueError:
-            try:
-                parsed_day = datetime.fromisoformat(day).date()
-            except ValueError:
-                raise HTTPException(status_code=422, detail="day must be ISO date or datetime") from None
+            raise HTTPException(status_code=422, detail="cursor is invalid") from None
+        if after[0].tzinfo is None:
+            after = (after[0].replace(tzinfo=UTC), after[1])
 
-    service = ScheduleService(repo=SqlAlchemyScheduleRepository(session), cache=cache, session=session)
-    slots = await service.list_available(provider_id=provider_id, date_filter=parsed_day)
-    return [SlotResponse.model_validate(slot.model_dump()) for slot in slots]
+    service = ScheduleService(
+        repo=SqlAlchemyScheduleRepository(session),
+        cache=cache,
+        session=session,
+        single_flight=single_flight,
+        # Cache fills only use a replica that has replayed past the last slot invalidation.
+        refresh_scope=repository_scope(SqlAlchemyScheduleRepository, family="slots"),
+    )
+    if day_range:
+        slots = await service.list_available_range(provider_id, *day_range, after=after, limit=limit)
+    else:
+        slots = await service.list_available(provider_id=provider_id, date_filter=None, after=after, limit=limit)
+    next_cursor = encode_cursor(slots[-1].starts_at.isoformat(), slots[-1].id) if len(slots) == limit else None
+    return Page[SlotResponse].model_validate({"items": slots, "next_cursor": next_cursor})
 
@@ -3,31 +3,56 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.schemas.pagination import Page, decode_cursor, encode_cursor
 from app.api.schemas.services import ServiceCreate, ServiceResponse
+from app.application.interfaces.cache import CacheProvider
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ServiceCursor
 from app.application.services.service import ServicesService
-from app.core.dependencies import get_cache, get_db_session
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.application.single_flight import SingleFlight
+from app.core.dependencies import (
+    get_cache,
+    get_db_session,
+    get_single_flight,
+    repository_scope,
+)
 from app.infrastructure.repositories.services import SqlAlchemyServiceRepository
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[ServiceResponse])
+@router.get("", response_model=Page[ServiceResponse])
 async def list_services(
     provider_id: UUID | None = Query(None),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     session: AsyncSession = Depends(get_db_session),
-    cache: RedisCache = Depends(get_cache),
-) -> list[ServiceResponse]:
-    service = ServicesService(repo=SqlAlchemyServiceRepository(session), cache=cache, session=session)
-    services = await service.list_services(provider_id)
-    return [ServiceResponse.model_validate(item.model_dump()) for item in services]
+    cache: CacheProvider = Depends(get_cache),
+    single_flight: SingleFlight = Depends(get_single_flight),
+) -> Page[ServiceResponse]:
+    after: ServiceCursor | None = None
+    if cursor:
+        title, service_id = decode_cursor(cursor, 2)
+        try:
+            after = (title, UUID(service_id))
+        except ValueError:
+            raise HTTPException(status_code=422, detail="cursor is invalid") from None
+    service = ServicesService(
+        repo=SqlAlchemyServiceRepository(session),
+        cache=cache,
+        session=session,
+        single_flight=single_flight,
+        refresh_scope=repository_scope(SqlAlchemyServiceRepository, family="services"),
+    )
+    services = await service.list_services(provider_id, after=after, limit=limit)
+    next_cursor = encode_cursor(services[-1].title, services[-1].id) if len(services) == limit else None
+    return Page[ServiceResponse].model_validate({"items": services, "next_cursor": next_cursor})
 
 
 @router.post("", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_service(
     payload: ServiceCreate,
     session: AsyncSession = Depends(get_db_session),
-    cache: RedisCache = Depends(get_cache),
+    cache: CacheProvider = Depends(get_cache),
 ) -> ServiceResponse:
     service = ServicesService(repo=SqlAlchemyServiceRepository(session), cache=cache, session=session)
     try:
@@ -39,5 +64,5 @@ async def create_service(
         )
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return ServiceResponse.model_validate(created.model_dump())
+    return ServiceResponse.model_validate(created)
 
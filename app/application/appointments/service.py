@@ -1,14 +1,38 @@
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces.cache import CacheProvider
 from app.application.interfaces.mq import EventPublisher
-from app.application.interfaces.repositories import AppointmentRepository, ScheduleRepository
+from app.application.interfaces.repositories import AppointmentRepository, OutboxRepository, ScheduleRepository
 from app.domain.appointments.entities import Appointment, AppointmentStatus
+from app.domain.schedules.entities import ScheduleSlot
+
+
+def _created_payload(appointment: Appointment) -> dict[str, Any]:
+    return {
+        "appointment_id": str(appointment.id),
+        "client_id": str(appointment.client_id),
+        "provider_id": str(appointment.provider_id),
+        "service_id": str(appointment.service_id),
+        "slot_id": str(appointment.slot_id),
+    }
+
+
+def _batch_items(appointments: Sequence[Appointment]) -> list[dict[str, str]]:
+    return [{"appointment_id": str(item.id), "slot_id": str(item.slot_id)} for item in appointments]
 
 
 class AppointmentService:
+    """Booking and cancellation use cases.
+
+    With an ``outbox`` the events are written in the booking transaction and published later
+    by the relay; without one they are published right after commit.
+    """
+
     def __init__(
         self,
         appointment_repo: AppointmentRepository,
@@ -16,52 +40,85 @@ class AppointmentService:
         cache: CacheProvider,
         publisher: EventPublisher,
         session: AsyncSession,
+        outbox: OutboxRepository | None = None,
     ):
         self.appointment_repo = appointment_repo
         self.schedule_repo = schedule_repo
         self.cache = cache
         self.publisher = publisher
         self.session = session
+        self.outbox = outbox
 
     async def create_appointment(
         self, client_id: UUID, provider_id: UUID, service_id: UUID, slot_id: UUID
     ) -> Appointment:
-        async def _do_create() -> Appointment:
-            slot = await self.schedule_repo.lock_slot(slot_id)
-            if slot is None or not slot.is_available:
-                raise ValueError("Slot is not available")
-            await self.schedule_repo.mark_slot_availability(slot_id, False)
-            appointment = await self.appointment_repo.create(
+        async def _do_create() -> tuple[Appointment, ScheduleSlot]:
+            booked = await self.appointment_repo.book(
                 client_id=client_id,
                 provider_id=provider_id,
                 service_id=service_id,
                 slot_id=slot_id,
                 status=AppointmentStatus.created,
             )
-            return appointment
+            if booked is None:
+                raise ValueError("Slot is not available")
+            await self._stage("appointment.created", _created_payload(booked[0]))
+            return booked
 
         if self.session.in_transaction():
-            appointment = await _do_create()
+            appointment, slot = await _do_create()
         else:
             async with self.session.begin():
-                appointment = await _do_create()
+                appointment, slot = await _do_create()
+
+        await self.cache.invalidate_slots(slot.provider_id, [slot.day])
+        await self._publish("appointment.created", _created_payload(appointment))
+        return appointment
 
-        await self.cache.invalidate_slots()
-        await self.publisher.publish(
-            routing_key="appointment.created",
-            payload={
-                "appointment_id": str(appointment.id),
+    async def create_appointments_batch(
+        self, client_id: UUID, provider_id: UUID, service_id: UUID, slot_ids: Sequence[UUID]
+    ) -> list[Appointment]:
+        """Book several slots at once: either every slot is booked or none is."""
+        if len(set(slot_ids)) != len(slot_ids):
+            raise ValueError("Duplicate slots in batch")
+
+        def batch_payload(appointments: Sequence[Appointment]) -> dict[str, Any]:
+            return {
                 "client_id": str(client_id),
                 "provider_id": str(provider_id),
                 "service_id": str(service_id),
-                "slot_id": str(slot_id),
-            },
-            headers={"attempt": 1, "event": "appointment.created"},
-        )
-        return appointment
+                "appointments": _batch_items(appointments),
+            }
+
+        async def _do_create() -> list[tuple[Appointment, ScheduleSlot]]:
+            booked = await self.appointment_repo.book_many(
+                client_id=client_id,
+                provider_id=provider_id,
+                service_id=service_id,
+                slot_ids=slot_ids,
+                status=AppointmentStatus.created,
+            )
+            if booked is None:
+                raise ValueError("Some slots are not available")
+            await self._stage("appointment.batch_created", batch_payload([item for item, _ in booked]))
+            return booked
+
+        if self.session.in_transaction():
+            booked = await _do_create()
+        else:
+            async with self.session.begin():
+                booked = await _do_create()
+
+        appointments = [appointment for appointment, _ in booked]
+        await self._invalidate_slots([slot for _, slot in booked])
+        await self._publish("appointment.batch_created", batch_payload(appointments))
+        return appointments
 
     async def cancel_appointment(self, appointment_id: UUID) -> Appointment:
-        async def _do_cancel() -> Appointment:
+        def cancel_payload(appointment: Appointment) -> dict[str, Any]:
+            return {"appointment_id": str(appointment_id), "slot_id": str(appointment.slot_id)}
+
+        async def _do_cancel() -> tuple[Appointment, ScheduleSlot | None]:
             appointment = await self.appointment_repo.get(appointment_id)
             if appointment is None:
                 raise ValueError("Appointment not found")
@@ -72,21 +129,74 @@ class AppointmentService:
             )
             if appointment is None:
                 raise ValueError("Unable to update appointment")
-            await self.schedule_repo.mark_slot_availability(appointment.slot_id, True)
-
-            return appointment
+            slot = await self.schedule_repo.mark_slot_availability(appointment.slot_id, True)
+            await self._stage("appointment.cancelled", cancel_payload(appointment))
+            return appointment, slot
 
         if self.session.in_transaction():
-            appointment = await _do_cancel()
+            appointment, slot = await _do_cancel()
         else:
             async with self.session.begin():
-                appointment = await _do_cancel()
-
-        await self.cache.invalidate_slots()
-        await self.publisher.publish(
-            routing_key="appointment.cancelled",
-            payload={"appointment_id": str(appointment_id), "slot_id": str(appointment.slot_id)},
-            headers={"attempt": 1, "event": "appointment.cancelled"},
-        )
+                appointment, slot = await _do_cancel()
+
+        if slot is not None:
+            await self.cache.invalidate_slots(slot.provider_id, [slot.day])
+        else:
+            await self.cache.invalidate_slots()
+        await self._publish("appointment.cancelled", cancel_payload(appointment))
         return appointment
 
+    async def cancel_appointments_bulk(
+        self,
+        provider_id: UUID | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        appointment_ids: Sequence[UUID] | None = None,
+    ) -> list[Appointment]:
+        """Cancel a provider's appointments over a day range, or an explicit id list, in one transaction."""
+        if appointment_ids is None and (provider_id is None or date_from is None or date_to is None):
+            raise ValueError("Either appointment ids or a provider with a date range is required")
+
+        def bulk_payload(appointments: Sequence[Appointment]) -> dict[str, Any]:
+            return {"provider_id": str(provider_id) if provider_id else None, "appointments": _batch_items(appointments)}
+
+        async def _do_cancel() -> list[tuple[Appointment, ScheduleSlot]]:
+            cancelled = await self.appointment_repo.cancel_many(
+                provider_id=provider_id,
+                date_from=date_from,
+                date_to=date_to,
+                appointment_ids=appointment_ids,
+            )
+            if cancelled:
+                await self._stage("appointment.batch_cancelled", bulk_payload([item for item, _ in cancelled]))
+            return cancelled
+
+        if self.session.in_transaction():
+            cancelled = await _do_cancel()
+        else:
+            async with self.session.begin():
+                cancelled = await _do_cancel()
+
+        if not cancelled:
+            return []
+        appointments = [appointment for appointment, _ in cancelled]
+        await self._invalidate_slots([slot for _, slot in cancelled])
+        await self._publish("appointment.batch_cancelled", bulk_payload(appointments))
+        return appointments
+
+    async def _invalidate_slots(self, slots: Sequence[ScheduleSlot]) -> None:
+        days_by_provider: dict[UUID, set[date]] = {}
+        for slot in slots:
+            days_by_provider.setdefault(slot.provider_id, set()).add(slot.day)
+        for provider_id, days in days_by_provider.items():
+            await self.cache.invalidate_slots(provider_id, days)
+
+    async def _stage(self, event: str, payload: dict[str, Any]) -> None:
+        """Inside the transaction: queue the event in the outbox, if there is one."""
+        if self.outbox is not None:
+            await self.outbox.add(routing_key=event, payload=payload, headers={"attempt": 1, "event": event})
+
+    async def _publish(self, event: str, payload: dict[str, Any]) -> None:
+        """After commit: publish directly unless the outbox relay will."""
+        if self.outbox is None:
+            await self.publisher.publish(routing_key=event, payload=payload, headers={"attempt": 1, "event": event})
@@ -1,20 +1,71 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import date
-from typing import Protocol
+from typing import Generic, Protocol, TypeVar
 from uuid import UUID
 
+from app.application.pagination import ServiceCursor, SlotCursor
 from app.domain.schedules.entities import ScheduleSlot
 from app.domain.services.entities import Service
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheEntry(Generic[T]):
+    value: Sequence[T]
+    # Past its soft expiry: still servable, but the caller should refresh it.
+    stale: bool = False
+
 
 class CacheProvider(Protocol):
-    async def get_services(self, provider_id: UUID | None) -> Sequence[Service] | None: ...
-    async def set_services(self, provider_id: UUID | None, services: Sequence[Service]) -> None: ...
+    """List cache; ``after``/``limit`` select one keyset page, ``limit=None`` the whole list.
+
+    ``get_slot_days``/``set_slot_days`` batch whole per-day slot lists, the unit date ranges
+    are composed from; days missing from the cache are absent from the result. Invalidation
+    always covers every page of the affected lists.
+
+    ``invalidated_at`` is the UNIX time of the last invalidation in a family ("services" or
+    "slots"), None when none is recorded; replica reads must be newer than it to fill the cache.
+    """
+
+    async def get_services(
+        self, provider_id: UUID | None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> CacheEntry[Service] | None: ...
+    async def set_services(
+        self,
+        provider_id: UUID | None,
+        services: Sequence[Service],
+        after: ServiceCursor | None = None,
+        limit: int | None = None,
+    ) -> None: ...
     async def invalidate_services(self) -> None: ...
 
-    async def get_slots(self, provider_id: UUID | None, date_filter: date | None) -> Sequence[ScheduleSlot] | None: ...
+    async def get_slots(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> CacheEntry[ScheduleSlot] | None: ...
     async def set_slots(
-        self, provider_id: UUID | None, date_filter: date | None, slots: Sequence[ScheduleSlot]
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        slots: Sequence[ScheduleSlot],
+        after: SlotCursor | None = None,
+        limit: int | None = None,
     ) -> None: ...
-    async def invalidate_slots(self) -> None: ...
+    async def get_slot_days(
+        self, provider_id: UUID | None, days: Sequence[date]
+    ) -> dict[date, CacheEntry[ScheduleSlot]]: ...
+    async def set_slot_days(self, provider_id: UUID | None, lists: Mapping[date, Sequence[ScheduleSlot]]) -> None: ...
+    async def invalidate_slots(self, provider_id: UUID | None = None, days: Iterable[date] = ()) -> None: ...
+
+    async def invalidated_at(self, family: str) -> float | None: ...
+
+
+class CacheLock(Protocol):
+    async def acquire(self, key: str, ttl_ms: int) -> str | None: ...
+    async def release(self, key: str, token: str) -> None: ...
 
@@ -3,6 +3,7 @@ from datetime import date, datetime
 from typing import Protocol
 from uuid import UUID
 
+from app.application.pagination import ServiceCursor, SlotCursor
 from app.domain.appointments.entities import Appointment, AppointmentStatus
 from app.domain.schedules.entities import ScheduleSlot
 from app.domain.services.entities import Service
@@ -15,15 +16,31 @@ class UserRepository(Protocol):
 
 
 class ServiceRepository(Protocol):
-    async def list(self, provider_id: UUID | None = None) -> Sequence[Service]: ...
+    async def list(
+        self, provider_id: UUID | None = None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> Sequence[Service]: ...
     async def create(self, provider_id: UUID, title: str, duration_min: int, price: float) -> Service: ...
 
 
 class ScheduleRepository(Protocol):
-    async def create_slot(self, provider_id: UUID, starts_at: datetime, ends_at: datetime) -> ScheduleSlot: ...
-    async def list_available(self, provider_id: UUID | None, date_filter: date | None) -> Sequence[ScheduleSlot]: ...
+    async def create_slot(self, provider_id: UUID, starts_at: datetime, ends_at: datetime) -> ScheduleSlot | None: ...
+    async def create_slots(
+        self, provider_id: UUID, windows: Sequence[tuple[datetime, datetime]]
+    ) -> Sequence[ScheduleSlot] | None: ...
+    async def list_overlapping(
+        self, provider_id: UUID, starts_at: datetime, ends_at: datetime
+    ) -> Sequence[ScheduleSlot]: ...
+    async def list_available(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+        until: date | None = None,
+    ) -> Sequence[ScheduleSlot]: ...
+    async def list_available_on(self, provider_id: UUID | None, days: Sequence[date]) -> Sequence[ScheduleSlot]: ...
+    async def list_available_between(self, starts_from: datetime, until: datetime) -> Sequence[ScheduleSlot]: ...
     async def mark_slot_availability(self, slot_id: UUID, is_available: bool) -> ScheduleSlot | None: ...
-    async def lock_slot(self, slot_id: UUID) -> ScheduleSlot | None: ...
 
 
 class AppointmentRepository(Protocol):
@@ -36,6 +53,35 @@ class AppointmentRepository(Protocol):
         status: AppointmentStatus = AppointmentStatus.created,
     ) -> Appointment: ...
 
+    async def book(
+        self,
+        client_id: UUID,
+        provider_id: UUID,
+        service_id: UUID,
+        slot_id: UUID,
+        status: AppointmentStatus = AppointmentStatus.created,
+    ) -> tuple[Appointment, ScheduleSlot] | None: ...
+
+    async def book_many(
+        self,
+        client_id: UUID,
+        provider_id: UUID,
+        service_id: UUID,
+        slot_ids: Sequence[UUID],
+        status: AppointmentStatus = AppointmentStatus.created,
+    ) -> list[tuple[Appointment, ScheduleSlot]] | None: ...
+
+    async def cancel_many(
+        self,
+        provider_id: UUID | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        appointment_ids: Sequence[UUID] | None = None,
+    ) -> list[tuple[Appointment, ScheduleSlot]]: ...
+
     async def get(self, appointment_id: UUID) -> Appointment | None: ...
     async def update_status(self, appointment_id: UUID, status: AppointmentStatus) -> Appointment | None: ...
 
+
+class OutboxRepository(Protocol):
+    async def add(self, routing_key: str, payload: dict, headers: dict | None = None) -> None: ...
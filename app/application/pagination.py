@@ -0,0 +1,9 @@
+from datetime import datetime
+from uuid import UUID
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Keyset positions: the sort key of the last item on the previous page.
+SlotCursor = tuple[datetime, UUID]
+ServiceCursor = tuple[str, UUID]
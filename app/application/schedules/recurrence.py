@@ -0,0 +1,38 @@
+from collections.abc import Collection
+from datetime import UTC, date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+MAX_BULK_SLOTS = 5000
+
+
+def expand_recurrence(
+    date_from: date,
+    date_to: date,
+    weekdays: Collection[int],
+    day_start: time,
+    day_end: time,
+    slot_minutes: int,
+    exceptions: Collection[date] = (),
+    tz: ZoneInfo | None = None,
+) -> list[tuple[datetime, datetime]]:
+    """Expand a weekly template into consecutive (starts_at, ends_at) UTC windows.
+
+    Working hours are wall-clock times in ``tz`` (UTC by default); ``weekdays`` follow
+    ``date.weekday()``, Monday is 0. Slots are stepped in UTC, so a day with a DST
+    transition gets one slot fewer or more instead of a skewed or empty window.
+    """
+    tzinfo = tz or UTC
+    length = timedelta(minutes=slot_minutes)
+    windows: list[tuple[datetime, datetime]] = []
+    day = date_from
+    while day <= date_to:
+        if day.weekday() in weekdays and day not in exceptions:
+            starts_at = datetime.combine(day, day_start, tzinfo).astimezone(UTC)
+            closes_at = datetime.combine(day, day_end, tzinfo).astimezone(UTC)
+            while starts_at + length <= closes_at:
+                windows.append((starts_at, starts_at + length))
+                if len(windows) > MAX_BULK_SLOTS:
+                    raise ValueError(f"Template expands to more than {MAX_BULK_SLOTS} slots")
+                starts_at += length
+        day += timedelta(days=1)
+    return windows
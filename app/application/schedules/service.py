@@ -1,36 +1,159 @@
-from datetime import date, datetime
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime, timedelta
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces.cache import CacheProvider
 from app.application.interfaces.repositories import ScheduleRepository
+from app.application.pagination import SlotCursor
+from app.application.single_flight import SingleFlight
 from app.domain.schedules.entities import ScheduleSlot
 
+MAX_RANGE_DAYS = 31
+
 
 class ScheduleService:
-    def __init__(self, repo: ScheduleRepository, cache: CacheProvider, session: AsyncSession):
+    def __init__(
+        self,
+        repo: ScheduleRepository,
+        cache: CacheProvider,
+        session: AsyncSession,
+        single_flight: SingleFlight | None = None,
+        refresh_scope: Callable[[], AbstractAsyncContextManager[ScheduleRepository]] | None = None,
+    ):
         self.repo = repo
         self.cache = cache
         self.session = session
+        self.single_flight = single_flight
+        # Shared and background fills can outlive the request's session, so they open their own.
+        self.refresh_scope = refresh_scope
 
     async def create_slot(self, provider_id: UUID, starts_at: datetime, ends_at: datetime) -> ScheduleSlot:
         slot = await self.repo.create_slot(provider_id=provider_id, starts_at=starts_at, ends_at=ends_at)
+        if slot is None:
+            raise ValueError("Slot overlaps an existing slot of the provider")
         await self.session.commit()
-        await self.cache.invalidate_slots()
+        await self.cache.invalidate_slots(slot.provider_id, [slot.day])
         return slot
 
-    async def list_available(self, provider_id: UUID | None, date_filter: date | None) -> list[ScheduleSlot]:
-        cached = await self.cache.get_slots(provider_id, date_filter)
-        if cached is not None:
-            return list(cached)
-        slots = list(await self.repo.list_available(provider_id, date_filter))
-        await self.cache.set_slots(provider_id, date_filter, slots)
-        return slots
+    async def create_slots_bulk(
+        self, provider_id: UUID, windows: Sequence[tuple[datetime, datetime]]
+    ) -> list[ScheduleSlot]:
+        if not windows:
+            return []
+        ordered = sorted(windows)
+        if any(previous_end > starts_at for (_, previous_end), (starts_at, _) in zip(ordered, ordered[1:], strict=False)):
+            raise ValueError("Slots overlap each other")
+        slots = await self.repo.create_slots(provider_id, ordered)
+        if slots is None:
+            raise ValueError("Slots overlap existing slots of the provider")
+        await self.session.commit()
+        await self.cache.invalidate_slots(provider_id, {slot.day for slot in slots})
+        return list(slots)
+
+    async def list_available(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> list[ScheduleSlot]:
+        if date_filter is not None and provider_id is not None:
+            return await self.list_available_range(provider_id, date_filter, date_filter, after, limit)
+        key = f"slots:{provider_id}:{date_filter}:{after}:{limit}"
+
+        async def _cached() -> list[ScheduleSlot] | None:
+            entry = await self.cache.get_slots(provider_id, date_filter, after, limit)
+            return list(entry.value) if entry is not None else None
+
+        async def _load(repo: ScheduleRepository) -> list[ScheduleSlot]:
+            slots = list(await repo.list_available(provider_id, date_filter, after, limit))
+            await self.cache.set_slots(provider_id, date_filter, slots, after, limit)
+            return slots
+
+        entry = await self.cache.get_slots(provider_id, date_filter, after, limit)
+        if self.single_flight is None or self.refresh_scope is None:
+            return list(entry.value) if entry is not None and not entry.stale else await _load(self.repo)
+        return await self.single_flight.serve(key, entry, self.refresh_scope, _load, recheck=_cached)
+
+    async def list_available_range(
+        self,
+        provider_id: UUID | None,
+        date_from: date,
+        date_to: date,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> list[ScheduleSlot]:
+        """Page through a range of UTC days.
+
+        A provider's range is composed from its per-day cache lists, loading only the days that are
+        missing. Across all providers a day can be too large to materialise for one page, so a single
+        day is paged and cached like the undated list, and a multi-day range is read page by page
+        from the database without caching: no scoped invalidation could find a key spanning days.
+        """
+        if not 0 <= (date_to - date_from).days < MAX_RANGE_DAYS:
+            raise ValueError(f"Date range must span 1 to {MAX_RANGE_DAYS} days")
+        if provider_id is None:
+            if date_from == date_to:
+                return await self.list_available(None, date_from, after, limit)
+            return list(await self.repo.list_available(None, date_from, after, limit, until=date_to))
+        days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+        entries = await self.cache.get_slot_days(provider_id, days)
+        lists = {day: list(entry.value) for day, entry in entries.items()}
+        stale = [day for day, entry in entries.items() if entry.stale]
+        missing = [day for day in days if day not in entries]
+        if stale and self.single_flight is not None and self.refresh_scope is not None:
+            self.single_flight.refresh(
+                self._days_key(provider_id, stale),
+                self.refresh_scope,
+                lambda repo: self._fill_days(repo, provider_id, stale),
+            )
+        else:
+            missing += stale
+        if missing:
+            lists.update(await self._load_days(provider_id, missing))
+
+        # Days are ascending and each list is ordered by (starts_at, id), so the concatenation is too.
+        slots = [slot for day in days for slot in lists[day]]
+        if after is not None:
+            slots = [slot for slot in slots if (slot.starts_at, slot.id) > after]
+        return slots[:limit] if limit else slots
+
+    async def _load_days(self, provider_id: UUID | None, days: list[date]) -> dict[date, list[ScheduleSlot]]:
+        async def _cached() -> dict[date, list[ScheduleSlot]] | None:
+            entries = await self.cache.get_slot_days(provider_id, days)
+            if len(entries) < len(days):
+                return None
+            return {day: list(entry.value) for day, entry in entries.items()}
+
+        if self.single_flight is None or self.refresh_scope is None:
+            return await self._fill_days(self.repo, provider_id, days)
+        return await self.single_flight.shared_load(
+            self._days_key(provider_id, days),
+            self.refresh_scope,
+            lambda repo: self._fill_days(repo, provider_id, days),
+            _cached,
+        )
+
+    async def _fill_days(
+        self, repo: ScheduleRepository, provider_id: UUID | None, days: list[date]
+    ) -> dict[date, list[ScheduleSlot]]:
+        lists: dict[date, list[ScheduleSlot]] = {day: [] for day in days}
+        for slot in await repo.list_available_on(provider_id, days):
+            lists[slot.day].append(slot)
+        await self.cache.set_slot_days(provider_id, lists)
+        return lists
+
+    @staticmethod
+    def _days_key(provider_id: UUID | None, days: list[date]) -> str:
+        return f"slots:{provider_id}:days:{','.join(day.isoformat() for day in sorted(days))}"
 
     async def mark_slot(self, slot_id: UUID, is_available: bool) -> ScheduleSlot | None:
         slot = await self.repo.mark_slot_availability(slot_id, is_available)
         await self.session.commit()
-        await self.cache.invalidate_slots()
+        if slot is not None:
+            await self.cache.invalidate_slots(slot.provider_id, [slot.day])
         return slot
 
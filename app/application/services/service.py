@@ -1,25 +1,49 @@
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces.cache import CacheProvider
 from app.application.interfaces.repositories import ServiceRepository
+from app.application.pagination import ServiceCursor
+from app.application.single_flight import SingleFlight
 from app.domain.services.entities import Service
 
 
 class ServicesService:
-    def __init__(self, repo: ServiceRepository, cache: CacheProvider, session: AsyncSession):
+    def __init__(
+        self,
+        repo: ServiceRepository,
+        cache: CacheProvider,
+        session: AsyncSession,
+        single_flight: SingleFlight | None = None,
+        refresh_scope: Callable[[], AbstractAsyncContextManager[ServiceRepository]] | None = None,
+    ):
         self.repo = repo
         self.cache = cache
         self.session = session
+        self.single_flight = single_flight
+        self.refresh_scope = refresh_scope
 
-    async def list_services(self, provider_id: UUID | None = None) -> list[Service]:
-        cached = await self.cache.get_services(provider_id)
-        if cached is not None:
-            return list(cached)
-        services = list(await self.repo.list(provider_id))
-        await self.cache.set_services(provider_id, services)
-        return services
+    async def list_services(
+        self, provider_id: UUID | None = None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> list[Service]:
+        key = f"services:{provider_id}:{after}:{limit}"
+
+        async def _cached() -> list[Service] | None:
+            entry = await self.cache.get_services(provider_id, after, limit)
+            return list(entry.value) if entry is not None else None
+
+        async def _load(repo: ServiceRepository) -> list[Service]:
+            services = list(await repo.list(provider_id, after, limit))
+            await self.cache.set_services(provider_id, services, after, limit)
+            return services
+
+        entry = await self.cache.get_services(provider_id, after, limit)
+        if self.single_flight is None or self.refresh_scope is None:
+            return list(entry.value) if entry is not None and not entry.stale else await _load(self.repo)
+        return await self.single_flight.serve(key, entry, self.refresh_scope, _load, recheck=_cached)
 
     async def create_service(self, provider_id: UUID, title: str, duration_min: int, price: float) -> Service:
         service = await self.repo.create(
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any, TypeVar
+
+from app.application.interfaces.cache import CacheEntry, CacheLock
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Coalesces concurrent cache fills so one loader hits the database per key.
+
+    Callers in the same process share one in-flight load. With a ``CacheLock`` the leader
+    also takes a short distributed lock; replicas that lose it poll the cache instead of
+    querying the database themselves, until the lock TTL runs out.
+    """
+
+    def __init__(self, lock: CacheLock | None = None, lock_ttl_ms: int = 3000, poll_interval: float = 0.05):
+        self.lock = lock
+        self.lock_ttl_ms = lock_ttl_ms
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def do(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None = None,
+    ) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            # The load runs as its own task so a cancelled leader doesn't fail the followers.
+            task = asyncio.ensure_future(self._load(key, load, recheck))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The leader's failure may be specific to its request (e.g. a closed session).
+            return await load()
+
+    async def serve(
+        self,
+        key: str,
+        entry: CacheEntry[T] | None,
+        scope: Callable[[], AbstractAsyncContextManager[R]],
+        load: Callable[[R], Awaitable[list[T]]],
+        recheck: Callable[[], Awaitable[list[T] | None]] | None = None,
+    ) -> list[T]:
+        """Return a fresh entry as is, a stale one while it is refreshed, and load a miss once for all callers."""
+        if entry is not None:
+            if entry.stale:
+                self.refresh(key, scope, load)
+            return list(entry.value)
+        return await self.shared_load(key, scope, load, recheck)
+
+    async def shared_load(
+        self,
+        key: str,
+        scope: Callable[[], AbstractAsyncContextManager[R]],
+        load: Callable[[R], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None = None,
+    ) -> T:
+        """``do`` with ``load`` run on a repository of its own, since it may outlive the caller."""
+        return await self.do(key, _in_scope(scope, load), recheck=recheck)
+
+    def refresh(
+        self, key: str, scope: Callable[[], AbstractAsyncContextManager[R]], load: Callable[[R], Awaitable[Any]]
+    ) -> None:
+        """``spawn`` with ``load`` run on a repository of its own."""
+        self.spawn(key, _in_scope(scope, load))
+
+    def spawn(self, key: str, load: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``load`` in the background unless a load for ``key`` is already in flight."""
+        # Refreshes keep their own slot: a miss after an invalidation must not be handed a refresh
+        # that started before it.
+        refresh_key = f"refresh:{key}"
+        if key in self._inflight or refresh_key in self._inflight:
+            return
+        task = asyncio.ensure_future(self._load(key, load, None))
+        self._inflight[refresh_key] = task
+
+        def _done(finished: asyncio.Task[Any]) -> None:
+            self._inflight.pop(refresh_key, None)
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning("Background refresh of %s failed: %s", key, finished.exception())
+
+        task.add_done_callback(_done)
+
+    async def _load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None,
+    ) -> T:
+        if self.lock is None or recheck is None:
+            return await load()
+        lock_key = f"lock:{key}"
+        token = await self.lock.acquire(lock_key, self.lock_ttl_ms)
+        if token is None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.lock_ttl_ms / 1000
+            while loop.time() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                cached = await recheck()
+                if cached is not None:
+                    return cached
+            return await load()
+        try:
+            return await load()
+        finally:
+            await self.lock.release(lock_key, token)
+
+
+def _in_scope(
+    scope: Callable[[], AbstractAsyncContextManager[R]], load: Callable[[R], Awaitable[T]]
+) -> Callable[[], Awaitable[T]]:
+    # Shared and background loads outlive the request that started them, so they must not use its session.
+    async def _load() -> T:
+        async with scope() as repo:
+            return await load(repo)
+
+    return _load
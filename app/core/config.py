@@ -31,23 +31,70 @@ def _debug_log(hypothesis_id: str, message: str, data: dict) -> None:
 
 class DatabaseSettings(BaseModel):
     url: str = Field(..., description="Database DSN in asyncpg format")
+    pool_size: int = Field(5, description="Connections kept open per engine (per uvicorn worker)")
+    max_overflow: int = Field(10, description="Extra connections opened above pool_size under load")
+    pool_timeout: float = Field(30.0, description="Seconds to wait for a free connection before failing")
+    pool_recycle: int = Field(1800, description="Reconnect connections older than this many seconds, -1 to disable")
+    pool_pre_ping: bool = Field(True, description="Ping each connection on checkout; costs a round trip")
+    statement_cache_size: int = Field(
+        100,
+        description="Prepared statement cache per connection; 0 (unique statement names) behind pgbouncer transaction pooling",
+    )
+    statement_timeout_ms: int = Field(0, description="Server-side statement_timeout, 0 keeps the server default")
+    replica_urls: list[str] = Field(
+        default_factory=list, description="Read replica DSNs for read-only queries and cache fills, as a JSON list"
+    )
+    replica_max_lag_seconds: float = Field(5.0, description="Replicas lagging further behind are skipped")
+    replica_check_interval_seconds: float = Field(5.0, description="How often replica lag is measured")
+    replica_clock_skew_seconds: float = Field(
+        1.0, description="Margin between app and database clocks when checking a replica replayed past an invalidation"
+    )
 
 
 class RedisSettings(BaseModel):
     url: str = Field(..., description="Redis URL")
     services_ttl_seconds: int = Field(900, description="TTL for services list cache")
     slots_ttl_seconds: int = Field(180, description="TTL for slots list cache")
+    stale_while_revalidate_seconds: int = Field(
+        0, description="How long expired lists may still be served while they are refreshed in the background"
+    )
+    compress_threshold_bytes: int = Field(4096, description="Compress cached lists larger than this")
+    warmup_on_startup: bool = Field(False, description="Preload upcoming slot lists when the API starts")
+    warmup_days: int = Field(7, description="How many days ahead the warm-up preloads")
+    warmup_batch_size: int = Field(500, description="Slot lists written per Redis pipeline during warm-up")
+    warmup_concurrency: int = Field(4, description="Pipelines in flight during warm-up")
+    local_cache_enabled: bool = Field(False, description="Keep an in-process cache tier in front of Redis")
+    local_cache_max_entries: int = Field(1024, description="Max lists kept in the in-process cache")
+    local_cache_ttl_seconds: float = Field(5.0, description="TTL for the in-process cache tier")
+    invalidation_channel: str = Field("cache:invalidate", description="Pub/sub channel for cache invalidations")
+    fill_lock_enabled: bool = Field(False, description="Coalesce cache fills across replicas with a Redis lock")
+    fill_lock_ttl_ms: int = Field(3000, description="TTL of the cache fill lock")
 
 
 class RabbitSettings(BaseModel):
     url: str = Field(..., description="RabbitMQ URL")
     notifications_queue: str = Field("notifications.send", description="Queue for notifications")
     max_retries: int = Field(3, description="Max retry attempts for sending events")
+    prefetch_count: int = Field(32, description="Unacked messages the broker pushes to one worker")
+    worker_concurrency: int = Field(8, description="Notifications a worker sends in parallel")
+    publisher_channels: int = Field(4, description="Long-lived channels shared by the API's event publishes")
+    async_dispatch: bool = Field(False, description="Publish events from a background queue instead of in the request")
+    dispatch_queue_size: int = Field(10000, description="Events buffered for background publishing")
+    dispatch_batch_size: int = Field(100, description="Events the background dispatcher publishes concurrently")
+    dispatch_enqueue_timeout_seconds: float = Field(
+        0.05, description="Wait for room in a full dispatch queue before publishing inline"
+    )
+    outbox_enabled: bool = Field(False, description="Write events to the outbox table in the booking transaction")
+    outbox_batch_size: int = Field(100, description="Events the outbox relay claims per transaction")
+    outbox_poll_interval_seconds: float = Field(1.0, description="Relay sleep when the outbox is empty")
 
 
 class TelegramSettings(BaseModel):
     bot_token: str | None = Field(None, description="Telegram bot token")
     chat_id: str | None = Field(None, description="Telegram chat id")
+    api_base_url: str = Field("https://api.telegram.org", description="Bot API endpoint")
+    timeout_seconds: float = Field(10.0, description="Timeout for one Bot API request")
+    max_connections: int = Field(10, description="Connections kept to the Bot API per worker")
 
 
 class AppSettings(BaseSettings):
@@ -63,8 +110,9 @@ class AppSettings(BaseSettings):
     db: DatabaseSettings
     redis: RedisSettings
     rabbit: RabbitSettings
-    telegram: TelegramSettings = TelegramSettings(bot_token=None, chat_id=None)
+    telegram: TelegramSettings = TelegramSettings.model_validate({})
     log_level: str = "INFO"
+    metrics_enabled: bool = True
 
 
 @lru_cache
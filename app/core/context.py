@@ -5,9 +5,14 @@ from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from app.application.interfaces.cache import CacheProvider
+from app.application.interfaces.mq import EventPublisher
+from app.application.single_flight import SingleFlight
 from app.core.config import AppSettings
-from app.infrastructure.cache.redis_cache import RedisCache
-from app.infrastructure.mq.publisher import EventPublisher
+from app.core.db import ReplicaRouter
+from app.infrastructure.cache.local_cache import LocalCache
+from app.infrastructure.mq.buffered_publisher import BufferedEventPublisher
+from app.infrastructure.mq.channel_pool import ChannelPool
 
 
 @dataclass
@@ -15,10 +20,20 @@ class AppContext:
     settings: AppSettings
     engine: AsyncEngine | None = None
     session_factory: async_sessionmaker[AsyncSession] | None = None
+    replicas: ReplicaRouter | None = None
     redis: Redis | None = None
-    cache: RedisCache | None = None
+    cache: CacheProvider | None = None
+    local_cache: LocalCache | None = None
+    single_flight: SingleFlight | None = None
     rabbit_connection: aio_pika.RobustConnection | None = None
+    channel_pool: ChannelPool | None = None
     publisher: EventPublisher | None = None
+    buffered_publisher: BufferedEventPublisher | None = None
+
+    def read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory for read-only work: a replica when one is configured and fresh enough."""
+        assert self.session_factory
+        return self.replicas.session_factory() if self.replicas else self.session_factory
 
     async def check_db(self) -> None:
         if not self.engine:
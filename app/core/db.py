@@ -1,5 +1,13 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
+from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -7,12 +15,86 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.core.config import DatabaseSettings
+from app.core.metrics import MetricsRegistry, registry
 
 Base = declarative_base()
 
+CHECKOUT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+checkout_seconds = registry.histogram(
+    "db_pool_checkout_seconds", "Time to get a connection from the pool, including waiting", CHECKOUT_BUCKETS
+)
+
+logger = logging.getLogger(__name__)
+
+# Zero when the replica has replayed everything it received: an idle primary would
+# otherwise look like a lagging replica. That only holds while WAL is streaming in, so a
+# replica whose receiver is down reports NULL (unknown lag) rather than looking caught up.
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+# Primary commit time of the last transaction the replica replayed; NULL before the first one.
+REPLAY_TIMESTAMP_SQL = text("SELECT pg_last_xact_replay_timestamp()")
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long every checkout took, labelled by the pool's logging name."""
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            checkout_seconds.observe(time.perf_counter() - started, pool=self._orig_logging_name or "default")
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def create_engine(database_url: str, settings: DatabaseSettings | None = None, name: str = "primary") -> AsyncEngine:
+    settings = settings or DatabaseSettings.model_validate({"url": database_url})
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": settings.statement_cache_size,
+        # SQLAlchemy keeps its own cache of asyncpg prepared statements on top of asyncpg's.
+        "prepared_statement_cache_size": settings.statement_cache_size,
+    }
+    if not settings.statement_cache_size:
+        # Behind pgbouncer a server connection may already hold a statement under asyncpg's sequential names.
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+    if settings.statement_timeout_ms:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.statement_timeout_ms)}
+    return create_async_engine(
+        database_url,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+        pool_logging_name=name,
+        connect_args=connect_args,
+    )
+
+
+def instrument_pool(engine: AsyncEngine, name: str, metrics: MetricsRegistry = registry) -> None:
+    """Expose pool occupancy as gauges read at scrape time."""
 
-def create_engine(database_url: str) -> AsyncEngine:
-    return create_async_engine(database_url, echo=False, pool_pre_ping=True)
+    def _read(attribute: str) -> Callable[[], float]:
+        # dispose() swaps in a new pool, so look it up on every read.
+        return lambda: float(getattr(engine.sync_engine.pool, attribute)())
+
+    metrics.gauge("db_pool_size", "Configured pool size").set_function(_read("size"), pool=name)
+    metrics.gauge("db_pool_checked_out", "Connections currently in use").set_function(_read("checkedout"), pool=name)
+    metrics.gauge(
+        "db_pool_overflow", "Connections open above pool_size; negative while the pool is still filling"
+    ).set_function(_read("overflow"), pool=name)
 
 
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -23,3 +105,96 @@ async def get_session(session_factory: async_sessionmaker[AsyncSession]) -> Asyn
     async with session_factory() as session:
         yield session
 
+
+class ReplicaRouter:
+    """Hands out read sessions round-robin across replicas that are close enough to the primary.
+
+    Lag is measured in the background; when no replica qualifies, reads go to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: Sequence[AsyncEngine],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 5.0,
+        clock_skew_seconds: float = 1.0,
+    ):
+        self.primary = primary
+        self.engines = list(replicas)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.clock_skew_seconds = clock_skew_seconds
+        self._factories = [create_session_factory(engine) for engine in self.engines]
+        self._healthy = [False] * len(self.engines)
+        self._next = 0
+        self._checker: asyncio.Task[None] | None = None
+
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        healthy = [factory for factory, ok in zip(self._factories, self._healthy, strict=True) if ok]
+        if not healthy:
+            return self.primary
+        self._next = (self._next + 1) % len(healthy)
+        return healthy[self._next]
+
+    @contextlib.asynccontextmanager
+    async def session_replayed_since(self, not_before: float | None) -> AsyncIterator[AsyncSession]:
+        """Read session that has seen every commit up to ``not_before`` (UNIX time), or the primary.
+
+        A replica qualifies once it has replayed a transaction committed after ``not_before``
+        plus the allowed clock skew; WAL replays in commit order, so everything earlier is in.
+        A quiet primary leaves nothing newer to replay, so such reads stay on the primary
+        until the next write reaches the replica.
+        """
+        factory = self.session_factory()
+        if factory is not self.primary and not_before is not None:
+            async with factory() as session:
+                if await self._replayed_since(session, not_before):
+                    yield session
+                    return
+            factory = self.primary
+        async with factory() as session:
+            yield session
+
+    async def check(self) -> None:
+        for index, engine in enumerate(self.engines):
+            try:
+                lag = await self._measure_lag(engine)
+            except Exception as exc:
+                logger.warning("Replica %s is unreachable: %s", engine.url.host, exc)
+                self._healthy[index] = False
+                continue
+            healthy = lag <= self.max_lag_seconds
+            if healthy != self._healthy[index]:
+                logger.info("Replica %s %s (lag %.1fs)", engine.url.host, "in use" if healthy else "skipped", lag)
+            self._healthy[index] = healthy
+
+    async def start(self) -> None:
+        await self.check()
+        self._checker = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._checker:
+            self._checker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._checker
+        for engine in self.engines:
+            await engine.dispose()
+
+    async def _measure_lag(self, engine: AsyncEngine) -> float:
+        async with engine.connect() as conn:
+            lag = (await conn.execute(REPLICA_LAG_SQL)).scalar_one()
+        return math.inf if lag is None else float(lag)
+
+    async def _replayed_since(self, session: AsyncSession, not_before: float) -> bool:
+        try:
+            replayed = (await session.execute(REPLAY_TIMESTAMP_SQL)).scalar_one()
+        except Exception as exc:
+            logger.warning("Replay position check failed, reading from the primary: %s", exc)
+            return False
+        return replayed is not None and replayed.timestamp() > not_before + self.clock_skew_seconds
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval_seconds)
+            await self.check()
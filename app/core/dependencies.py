@@ -1,11 +1,19 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import TypeVar
 
+from fastapi import Depends
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.core.context as app_ctx
-from app.infrastructure.cache.redis_cache import RedisCache
-from app.infrastructure.mq.publisher import EventPublisher
+from app.application.interfaces.cache import CacheProvider
+from app.application.interfaces.mq import EventPublisher
+from app.application.interfaces.repositories import OutboxRepository
+from app.application.single_flight import SingleFlight
+from app.infrastructure.repositories.outbox import SqlAlchemyOutboxRepository
+
+R = TypeVar("R")
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -14,11 +22,47 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def get_cache() -> RedisCache:
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only routes; may be served by a read replica."""
+    assert app_ctx.app_context and app_ctx.app_context.session_factory
+    async with app_ctx.app_context.read_session_factory()() as session:
+        yield session
+
+
+def repository_scope(
+    factory: Callable[[AsyncSession], R], family: str | None = None
+) -> Callable[[], AbstractAsyncContextManager[R]]:
+    """Build repositories on a fresh session, for work that outlives the request.
+
+    With a cache ``family`` the session may come from a replica that has replayed past the
+    family's last invalidation, so fills never cache data older than it; otherwise the primary.
+    """
+
+    @asynccontextmanager
+    async def _scope() -> AsyncIterator[R]:
+        context = app_ctx.app_context
+        assert context and context.session_factory
+        if family is None or context.replicas is None or context.cache is None:
+            async with context.session_factory() as session:
+                yield factory(session)
+            return
+        not_before = await context.cache.invalidated_at(family)
+        async with context.replicas.session_replayed_since(not_before) as session:
+            yield factory(session)
+
+    return _scope
+
+
+async def get_cache() -> CacheProvider:
     assert app_ctx.app_context and app_ctx.app_context.cache
     return app_ctx.app_context.cache
 
 
+async def get_single_flight() -> SingleFlight:
+    assert app_ctx.app_context and app_ctx.app_context.single_flight
+    return app_ctx.app_context.single_flight
+
+
 async def get_redis() -> Redis:
     assert app_ctx.app_context and app_ctx.app_context.redis
     return app_ctx.app_context.redis
@@ -28,3 +72,10 @@ async def get_publisher() -> EventPublisher:
     assert app_ctx.app_context and app_ctx.app_context.publisher
     return app_ctx.app_context.publisher
 
+
+async def get_outbox(session: AsyncSession = Depends(get_db_session)) -> OutboxRepository | None:
+    """Outbox on the request's session, so events commit with the change; None when publishing inline."""
+    assert app_ctx.app_context
+    if not app_ctx.app_context.settings.rabbit.outbox_enabled:
+        return None
+    return SqlAlchemyOutboxRepository(session)
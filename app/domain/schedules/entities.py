@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -11,4 +11,9 @@ class ScheduleSlot(BaseModel):
     ends_at: datetime
     is_available: bool
 
+    @property
+    def day(self) -> date:
+        starts_at = self.starts_at.astimezone(UTC) if self.starts_at.tzinfo else self.starts_at
+        return starts_at.date()
+
 
@@ -0,0 +1,74 @@
+"""Compact binary format for cached lists.
+
+Layout: ``version:u8 | flags:u8 | soft_expires_at:f64`` followed by a JSON array of rows,
+zlib-compressed when it exceeds the configured threshold. Rows are positional tuples and
+are decoded with ``model_construct``: the cache only ever holds data we wrote ourselves,
+so re-running validation on every read is wasted work.
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from app.domain.schedules.entities import ScheduleSlot
+from app.domain.services.entities import Service
+
+FORMAT_VERSION = 1
+FLAG_ZLIB = 0x01
+HEADER = struct.Struct(">BBd")
+
+T = TypeVar("T")
+
+
+def encode(rows: Sequence[Sequence[Any]], soft_expires_at: float, compress_threshold: int) -> bytes:
+    body = json.dumps(rows, separators=(",", ":")).encode()
+    flags = 0
+    if len(body) > compress_threshold:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_ZLIB
+    return HEADER.pack(FORMAT_VERSION, flags, soft_expires_at) + body
+
+
+def decode(raw: bytes, from_row: Callable[[list[Any]], T]) -> tuple[list[T], float] | None:
+    """Return the decoded items and their soft expiry, or None for unknown or older formats."""
+    if len(raw) < HEADER.size:
+        return None
+    version, flags, soft_expires_at = HEADER.unpack_from(raw)
+    if version != FORMAT_VERSION:
+        return None
+    body = raw[HEADER.size :]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    return [from_row(row) for row in json.loads(body)], soft_expires_at
+
+
+def slot_to_row(slot: ScheduleSlot) -> tuple[Any, ...]:
+    return (slot.id.hex, slot.provider_id.hex, slot.starts_at.isoformat(), slot.ends_at.isoformat(), slot.is_available)
+
+
+def slot_from_row(row: list[Any]) -> ScheduleSlot:
+    return ScheduleSlot.model_construct(
+        id=UUID(hex=row[0]),
+        provider_id=UUID(hex=row[1]),
+        starts_at=datetime.fromisoformat(row[2]),
+        ends_at=datetime.fromisoformat(row[3]),
+        is_available=row[4],
+    )
+
+
+def service_to_row(service: Service) -> tuple[Any, ...]:
+    return (service.id.hex, service.provider_id.hex, service.title, service.duration_min, service.price)
+
+
+def service_from_row(row: list[Any]) -> Service:
+    return Service.model_construct(
+        id=UUID(hex=row[0]),
+        provider_id=UUID(hex=row[1]),
+        title=row[2],
+        duration_min=row[3],
+        price=row[4],
+    )
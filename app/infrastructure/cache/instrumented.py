@@ -0,0 +1,114 @@
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date
+from uuid import UUID
+
+from app.application.interfaces.cache import CacheEntry, CacheProvider
+from app.application.pagination import ServiceCursor, SlotCursor
+from app.core.metrics import MetricsRegistry, registry
+from app.domain.schedules.entities import ScheduleSlot
+from app.domain.services.entities import Service
+
+PAYLOAD_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+KEY_COUNT_BUCKETS = (0, 1, 2, 4, 8, 16, 64, 256)
+
+
+class CacheMetrics:
+    def __init__(self, metrics: MetricsRegistry = registry):
+        self.requests = metrics.counter("cache_requests_total", "Cache lookups by family and result (hit, stale, miss)")
+        self.get_seconds = metrics.histogram("cache_get_seconds", "Cache lookup latency")
+        self.set_seconds = metrics.histogram("cache_set_seconds", "Cache write latency")
+        self.payload_bytes = metrics.histogram(
+            "cache_payload_bytes", "Size of cached payloads read and written", PAYLOAD_BUCKETS
+        )
+        self.invalidations = metrics.counter("cache_invalidations_total", "Invalidation calls by family and scope")
+        self.invalidated_keys = metrics.histogram(
+            "cache_invalidated_keys", "Keys deleted by one scoped invalidation", KEY_COUNT_BUCKETS
+        )
+
+
+class InstrumentedCache(CacheProvider):
+    """Records hit rate, latency and invalidations of the wrapped cache provider."""
+
+    def __init__(self, inner: CacheProvider, metrics: CacheMetrics):
+        self.inner = inner
+        self.metrics = metrics
+
+    async def get_services(
+        self, provider_id: UUID | None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> CacheEntry[Service] | None:
+        started = time.perf_counter()
+        entry = await self.inner.get_services(provider_id, after, limit)
+        self._record_get("services", entry, started)
+        return entry
+
+    async def set_services(
+        self,
+        provider_id: UUID | None,
+        services: Sequence[Service],
+        after: ServiceCursor | None = None,
+        limit: int | None = None,
+    ) -> None:
+        started = time.perf_counter()
+        await self.inner.set_services(provider_id, services, after, limit)
+        self.metrics.set_seconds.observe(time.perf_counter() - started, family="services")
+
+    async def invalidate_services(self) -> None:
+        self.metrics.invalidations.inc(family="services", scope="all")
+        await self.inner.invalidate_services()
+
+    async def get_slots(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> CacheEntry[ScheduleSlot] | None:
+        started = time.perf_counter()
+        entry = await self.inner.get_slots(provider_id, date_filter, after, limit)
+        self._record_get("slots", entry, started)
+        return entry
+
+    async def set_slots(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        slots: Sequence[ScheduleSlot],
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> None:
+        started = time.perf_counter()
+        await self.inner.set_slots(provider_id, date_filter, slots, after, limit)
+        self.metrics.set_seconds.observe(time.perf_counter() - started, family="slots")
+
+    async def get_slot_days(
+        self, provider_id: UUID | None, days: Sequence[date]
+    ) -> dict[date, CacheEntry[ScheduleSlot]]:
+        started = time.perf_counter()
+        entries = await self.inner.get_slot_days(provider_id, days)
+        self.metrics.get_seconds.observe(time.perf_counter() - started, family="slots")
+        for day in days:
+            self._record_result("slots", entries.get(day))
+        return entries
+
+    async def set_slot_days(self, provider_id: UUID | None, lists: Mapping[date, Sequence[ScheduleSlot]]) -> None:
+        started = time.perf_counter()
+        await self.inner.set_slot_days(provider_id, lists)
+        self.metrics.set_seconds.observe(time.perf_counter() - started, family="slots")
+
+    async def invalidate_slots(self, provider_id: UUID | None = None, days: Iterable[date] = ()) -> None:
+        days = list(days)
+        scope = "provider_day" if provider_id is not None and days else "all"
+        self.metrics.invalidations.inc(family="slots", scope=scope)
+        await self.inner.invalidate_slots(provider_id, days)
+
+    async def invalidated_at(self, family: str) -> float | None:
+        return await self.inner.invalidated_at(family)
+
+    def _record_get(self, family: str, entry: CacheEntry | None, started: float) -> None:
+        self.metrics.get_seconds.observe(time.perf_counter() - started, family=family)
+        self._record_result(family, entry)
+
+    def _record_result(self, family: str, entry: CacheEntry | None) -> None:
+        result = "miss" if entry is None else "stale" if entry.stale else "hit"
+        self.metrics.requests.inc(family=family, result=result)
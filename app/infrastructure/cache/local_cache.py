@@ -0,0 +1,222 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date
+from typing import Any
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from app.application.interfaces.cache import CacheEntry, CacheProvider
+from app.application.pagination import ServiceCursor, SlotCursor
+from app.core.config import RedisSettings
+from app.domain.schedules.entities import ScheduleSlot
+from app.domain.services.entities import Service
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache(CacheProvider):
+    """Bounded in-process LRU/TTL tier in front of another cache provider.
+
+    Invalidations are broadcast over a Redis pub/sub channel so every API replica drops
+    its local copies; the short TTL bounds staleness if a message is missed.
+    """
+
+    def __init__(self, inner: CacheProvider, client: Redis, settings: RedisSettings):
+        self.inner = inner
+        self.client = client
+        self.settings = settings
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, tuple[Any, ...]]] = OrderedDict()
+        self._epoch = 0
+        self._node_id = uuid4().hex
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.settings.invalidation_channel)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def aclose(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+        if self._pubsub:
+            await self._pubsub.reset()
+
+    async def get_services(
+        self, provider_id: UUID | None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> CacheEntry[Service] | None:
+        key = ("services", provider_id, after, limit)
+        cached = self._get(key)
+        if cached is not None:
+            return CacheEntry(cached)
+        epoch = self._epoch
+        entry = await self.inner.get_services(provider_id, after, limit)
+        if entry is not None and not entry.stale:
+            self._put(key, entry.value, epoch)
+        return entry
+
+    async def set_services(
+        self,
+        provider_id: UUID | None,
+        services: Sequence[Service],
+        after: ServiceCursor | None = None,
+        limit: int | None = None,
+    ) -> None:
+        epoch = self._epoch
+        await self.inner.set_services(provider_id, services, after, limit)
+        self._put(("services", provider_id, after, limit), services, epoch)
+
+    async def invalidate_services(self) -> None:
+        self._evict_services()
+        await self.inner.invalidate_services()
+        await self._broadcast({"family": "services"})
+
+    async def get_slots(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> CacheEntry[ScheduleSlot] | None:
+        key = ("slots", provider_id, date_filter, after, limit)
+        cached = self._get(key)
+        if cached is not None:
+            return CacheEntry(cached)
+        epoch = self._epoch
+        entry = await self.inner.get_slots(provider_id, date_filter, after, limit)
+        if entry is not None and not entry.stale:
+            self._put(key, entry.value, epoch)
+        return entry
+
+    async def set_slots(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        slots: Sequence[ScheduleSlot],
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> None:
+        epoch = self._epoch
+        await self.inner.set_slots(provider_id, date_filter, slots, after, limit)
+        self._put(("slots", provider_id, date_filter, after, limit), slots, epoch)
+
+    async def get_slot_days(
+        self, provider_id: UUID | None, days: Sequence[date]
+    ) -> dict[date, CacheEntry[ScheduleSlot]]:
+        entries: dict[date, CacheEntry[ScheduleSlot]] = {}
+        for day in days:
+            cached = self._get(("slots", provider_id, day, None, None))
+            if cached is not None:
+                entries[day] = CacheEntry(cached)
+        missing = [day for day in days if day not in entries]
+        if not missing:
+            return entries
+        epoch = self._epoch
+        for day, entry in (await self.inner.get_slot_days(provider_id, missing)).items():
+            if not entry.stale:
+                self._put(("slots", provider_id, day, None, None), entry.value, epoch)
+            entries[day] = entry
+        return entries
+
+    async def set_slot_days(self, provider_id: UUID | None, lists: Mapping[date, Sequence[ScheduleSlot]]) -> None:
+        epoch = self._epoch
+        await self.inner.set_slot_days(provider_id, lists)
+        for day, slots in lists.items():
+            self._put(("slots", provider_id, day, None, None), slots, epoch)
+
+    async def invalidate_slots(self, provider_id: UUID | None = None, days: Iterable[date] = ()) -> None:
+        days = set(days)
+        self._evict_slots(provider_id, days)
+        await self.inner.invalidate_slots(provider_id, days)
+        await self._broadcast(
+            {
+                "family": "slots",
+                "provider_id": str(provider_id) if provider_id else None,
+                "days": [day.isoformat() for day in days],
+            }
+        )
+
+    async def invalidated_at(self, family: str) -> float | None:
+        return await self.inner.invalidated_at(family)
+
+    def handle_message(self, raw: bytes | str) -> None:
+        message = json.loads(raw)
+        if message.get("origin") == self._node_id:
+            return
+        if message.get("family") == "services":
+            self._evict_services()
+        elif message.get("family") == "slots":
+            provider_id = UUID(message["provider_id"]) if message.get("provider_id") else None
+            days = {date.fromisoformat(day) for day in message.get("days", [])}
+            self._evict_slots(provider_id, days)
+
+    def _get(self, key: tuple[Any, ...]) -> tuple[Any, ...] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: tuple[Any, ...], value: Sequence[Any], epoch: int) -> None:
+        # An invalidation that raced with the inner read makes the value suspect; don't keep it.
+        if epoch != self._epoch:
+            return
+        self._entries[key] = (time.monotonic() + self.settings.local_cache_ttl_seconds, tuple(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.settings.local_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict_services(self) -> None:
+        self._epoch += 1
+        for key in [key for key in self._entries if key[0] == "services"]:
+            del self._entries[key]
+
+    def _evict_slots(self, provider_id: UUID | None, days: set[date]) -> None:
+        self._epoch += 1
+        if provider_id is None or not days:
+            for key in [key for key in self._entries if key[0] == "slots"]:
+                del self._entries[key]
+            return
+        # Entries are keyed per page; drop every page of the affected lists.
+        lists: set[tuple[Any, ...]] = {(provider_id, None), (None, None)}
+        for day in days:
+            lists.add((provider_id, day))
+            lists.add((None, day))
+        for key in [key for key in self._entries if key[0] == "slots" and key[1:3] in lists]:
+            del self._entries[key]
+
+    async def _broadcast(self, message: dict[str, Any]) -> None:
+        message["origin"] = self._node_id
+        try:
+            await self.client.publish(self.settings.invalidation_channel, json.dumps(message))
+        except Exception as exc:  # other replicas fall back to the local TTL
+            logger.warning("Failed to broadcast cache invalidation: %s", exc)
+
+    async def _listen(self) -> None:
+        assert self._pubsub
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # Messages may have been lost while disconnected; start from a clean slate.
+                logger.warning("Cache invalidation listener failed, resubscribing: %s", exc)
+                self._epoch += 1
+                self._entries.clear()
+            await asyncio.sleep(1)
@@ -1,67 +1,232 @@
-import json
-from collections.abc import Sequence
-from datetime import date
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import date, datetime
+from typing import Any, TypeVar
 from uuid import UUID
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
-from app.application.interfaces.cache import CacheProvider
+from app.application.interfaces.cache import CacheEntry, CacheProvider
+from app.application.pagination import ServiceCursor, SlotCursor
 from app.core.config import RedisSettings
 from app.domain.schedules.entities import ScheduleSlot
 from app.domain.services.entities import Service
+from app.infrastructure.cache import codec
+from app.infrastructure.cache.instrumented import CacheMetrics
+
+SERVICES_GENERATION_KEY = "services:generation"
+SLOTS_GENERATION_KEY = "slots:generation"
+
+T = TypeVar("T")
 
 
 class RedisCache(CacheProvider):
-    def __init__(self, client: Redis, settings: RedisSettings):
+    """List cache whose keys embed a per-family generation; invalidation bumps it with one INCR.
+
+    Each list key is a hash with one field per cached page, so deleting the key drops every
+    page of that list. Entries carry a soft expiry at the family TTL and are kept for another
+    ``stale_while_revalidate_seconds`` after it, so readers can serve them while refreshing.
+
+    The generation is read in the same pipeline as the data, for the generation this process
+    saw last; only when the counter has moved since are the commands repeated.
+    """
+
+    def __init__(self, client: Redis, settings: RedisSettings, metrics: CacheMetrics | None = None):
         self.client = client
         self.settings = settings
+        # Payload sizes and deleted key counts are only visible here, not to a wrapping provider.
+        self.metrics = metrics
+        self._generations: dict[str, int] = {}
 
-    async def get_services(self, provider_id: UUID | None) -> Sequence[Service] | None:
-        key = self._services_key(provider_id)
-        raw = await self.client.get(key)
-        if not raw:
-            return None
-        data = json.loads(raw)
-        return [Service(**item) for item in data]
+    async def get_services(
+        self, provider_id: UUID | None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> CacheEntry[Service] | None:
+        field = self._page_field(after, limit)
+        (raw,) = await self._at_generation(
+            SERVICES_GENERATION_KEY, lambda pipe, generation: pipe.hget(self._services_key(generation, provider_id), field)
+        )
+        return self._entry("services", raw, codec.service_from_row)
+
+    async def set_services(
+        self,
+        provider_id: UUID | None,
+        services: Sequence[Service],
+        after: ServiceCursor | None = None,
+        limit: int | None = None,
+    ) -> None:
+        rows = [codec.service_to_row(service) for service in services]
+        payload, expire = self._payload(rows, self.settings.services_ttl_seconds)
+        self._record_payload("services", "set", payload)
+        field = self._page_field(after, limit)
+
+        def _write(pipe: Pipeline, generation: int) -> None:
+            key = self._services_key(generation, provider_id)
+            pipe.hset(key, field, payload)
+            pipe.expire(key, expire)
 
-    async def set_services(self, provider_id: UUID | None, services: Sequence[Service]) -> None:
-        key = self._services_key(provider_id)
-        payload = json.dumps([service.model_dump() for service in services], default=str)
-        await self.client.set(key, payload, ex=self.settings.services_ttl_seconds)
+        await self._at_generation(SERVICES_GENERATION_KEY, _write)
 
     async def invalidate_services(self) -> None:
-        await self._invalidate_pattern("services:list:*")
+        await self._bump(SERVICES_GENERATION_KEY, "services")
 
-    async def get_slots(self, provider_id: UUID | None, date_filter: date | None) -> Sequence[ScheduleSlot] | None:
-        key = self._slots_key(provider_id, date_filter)
-        raw = await self.client.get(key)
-        if not raw:
-            return None
-        data = json.loads(raw)
-        return [ScheduleSlot(**item) for item in data]
+    async def get_slots(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> CacheEntry[ScheduleSlot] | None:
+        field = self._page_field(after, limit)
+        (raw,) = await self._at_generation(
+            SLOTS_GENERATION_KEY,
+            lambda pipe, generation: pipe.hget(self._slots_key(generation, provider_id, date_filter), field),
+        )
+        return self._entry("slots", raw, codec.slot_from_row)
 
     async def set_slots(
-        self, provider_id: UUID | None, date_filter: date | None, slots: Sequence[ScheduleSlot]
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        slots: Sequence[ScheduleSlot],
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+    ) -> None:
+        rows = [codec.slot_to_row(slot) for slot in slots]
+        payload, expire = self._payload(rows, self.settings.slots_ttl_seconds)
+        self._record_payload("slots", "set", payload)
+        field = self._page_field(after, limit)
+
+        def _write(pipe: Pipeline, generation: int) -> None:
+            key = self._slots_key(generation, provider_id, date_filter)
+            pipe.hset(key, field, payload)
+            pipe.expire(key, expire)
+
+        await self._at_generation(SLOTS_GENERATION_KEY, _write)
+
+    async def get_slot_days(
+        self, provider_id: UUID | None, days: Sequence[date]
+    ) -> dict[date, CacheEntry[ScheduleSlot]]:
+        field = self._page_field(None, None)
+
+        def _read(pipe: Pipeline, generation: int) -> None:
+            for day in days:
+                pipe.hget(self._slots_key(generation, provider_id, day), field)
+
+        payloads = await self._at_generation(SLOTS_GENERATION_KEY, _read)
+        entries = {}
+        for day, raw in zip(days, payloads, strict=True):
+            entry = self._entry("slots", raw, codec.slot_from_row)
+            if entry is not None:
+                entries[day] = entry
+        return entries
+
+    async def set_slot_days(self, provider_id: UUID | None, lists: Mapping[date, Sequence[ScheduleSlot]]) -> None:
+        await self.set_slots_many([(provider_id, day, slots) for day, slots in lists.items()])
+
+    async def set_slots_many(
+        self, lists: Sequence[tuple[UUID | None, date | None, Sequence[ScheduleSlot]]]
     ) -> None:
-        key = self._slots_key(provider_id, date_filter)
-        payload = json.dumps([slot.model_dump() for slot in slots], default=str)
-        await self.client.set(key, payload, ex=self.settings.slots_ttl_seconds)
+        """Write several complete slot lists in one pipelined round trip."""
+        field = self._page_field(None, None)
+        payloads = []
+        for provider_id, date_filter, slots in lists:
+            payload, expire = self._payload([codec.slot_to_row(slot) for slot in slots], self.settings.slots_ttl_seconds)
+            self._record_payload("slots", "set", payload)
+            payloads.append((provider_id, date_filter, payload, expire))
+
+        def _write(pipe: Pipeline, generation: int) -> None:
+            for provider_id, date_filter, payload, expire in payloads:
+                key = self._slots_key(generation, provider_id, date_filter)
+                pipe.hset(key, field, payload)
+                pipe.expire(key, expire)
+
+        await self._at_generation(SLOTS_GENERATION_KEY, _write)
+
+    async def invalidate_slots(self, provider_id: UUID | None = None, days: Iterable[date] = ()) -> None:
+        days = set(days)
+        if provider_id is None or not days:
+            await self._bump(SLOTS_GENERATION_KEY, "slots")
+            return
+
+        # A write to one provider/day only affects that list and the aggregates that include it.
+        def _delete(pipe: Pipeline, generation: int) -> None:
+            keys = {self._slots_key(generation, provider_id, None), self._slots_key(generation, None, None)}
+            for day in days:
+                keys.add(self._slots_key(generation, provider_id, day))
+                keys.add(self._slots_key(generation, None, day))
+            pipe.delete(*keys)
+            pipe.set(self._invalidated_at_key("slots"), time.time())
 
-    async def invalidate_slots(self) -> None:
-        await self._invalidate_pattern("slots:list:*")
+        deleted, _ = await self._at_generation(SLOTS_GENERATION_KEY, _delete)
+        if self.metrics:
+            self.metrics.invalidated_keys.observe(deleted, family="slots")
 
-    async def _invalidate_pattern(self, pattern: str) -> None:
-        async for key in self.client.scan_iter(match=pattern):
-            await self.client.delete(key)
+    async def invalidated_at(self, family: str) -> float | None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.get(self._invalidated_at_key(family))
+            (raw,) = await pipe.execute()
+        return float(raw) if raw else None
+
+    async def _bump(self, counter_key: str, family: str) -> None:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incr(counter_key)
+            pipe.set(self._invalidated_at_key(family), time.time())
+            generation, _ = await pipe.execute()
+        self._generations[counter_key] = int(generation)
+
+    def _entry(self, family: str, raw: bytes | None, from_row: Callable[[list[Any]], T]) -> CacheEntry[T] | None:
+        self._record_payload(family, "get", raw)
+        decoded = codec.decode(raw, from_row) if raw else None
+        if decoded is None:
+            return None
+        items, soft_expires_at = decoded
+        now = time.time()
+        # Writing any page extends the hash TTL, so older pages enforce their own hard expiry.
+        if now >= soft_expires_at + self.settings.stale_while_revalidate_seconds:
+            return None
+        return CacheEntry(items, stale=now >= soft_expires_at)
+
+    def _record_payload(self, family: str, operation: str, payload: bytes | None) -> None:
+        if self.metrics and payload:
+            self.metrics.payload_bytes.observe(len(payload), family=family, operation=operation)
+
+    def _payload(self, rows: Sequence[Sequence[object]], ttl_seconds: int) -> tuple[bytes, int]:
+        payload = codec.encode(rows, time.time() + ttl_seconds, self.settings.compress_threshold_bytes)
+        return payload, ttl_seconds + self.settings.stale_while_revalidate_seconds
+
+    async def _at_generation(self, counter_key: str, commands: Callable[[Pipeline, int], object]) -> list[Any]:
+        """Queue ``commands`` for the last seen generation behind a read of the counter; returns their results."""
+        generation = self._generations.get(counter_key, 0)
+        while True:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.get(counter_key)
+                commands(pipe, generation)
+                raw, *results = await pipe.execute()
+            current = int(raw) if raw else 0
+            if current == generation:
+                return results
+            # Commands that ran against the old generation touched unreachable keys; they expire on their own.
+            self._generations[counter_key] = generation = current
+
+    @staticmethod
+    def _invalidated_at_key(family: str) -> str:
+        return f"{family}:invalidated_at"
+
+    @staticmethod
+    def _page_field(after: tuple[object, ...] | None, limit: int | None) -> str:
+        if limit is None:
+            return "all"
+        position = ",".join(value.isoformat() if isinstance(value, datetime) else str(value) for value in after or ())
+        return f"{limit}:{position}"
 
     @staticmethod
-    def _services_key(provider_id: UUID | None) -> str:
+    def _services_key(generation: int, provider_id: UUID | None) -> str:
         suffix = str(provider_id) if provider_id else "all"
-        return f"services:list:{suffix}"
+        return f"services:list:g{generation}:{suffix}"
 
     @staticmethod
-    def _slots_key(provider_id: UUID | None, date_filter: date | None) -> str:
+    def _slots_key(generation: int, provider_id: UUID | None, date_filter: date | None) -> str:
         provider_part = str(provider_id) if provider_id else "all"
         date_part = date_filter.isoformat() if date_filter else "any"
-        return f"slots:list:provider:{provider_part}:date:{date_part}"
-
+        return f"slots:list:g{generation}:provider:{provider_part}:date:{date_part}"
@@ -0,0 +1,26 @@
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from app.application.interfaces.cache import CacheLock
+
+# Delete the lock only if it is still ours; it may have expired and been taken by another replica.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLock(CacheLock):
+    def __init__(self, client: Redis):
+        self.client = client
+
+    async def acquire(self, key: str, ttl_ms: int) -> str | None:
+        token = uuid4().hex
+        acquired = await self.client.set(key, token, nx=True, px=ttl_ms)
+        return token if acquired else None
+
+    async def release(self, key: str, token: str) -> None:
+        await self.client.eval(RELEASE_SCRIPT, 1, key, token)
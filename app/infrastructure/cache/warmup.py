@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import UTC, date, datetime, time, timedelta
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.db import create_engine, create_session_factory
+from app.core.logging import setup_logging
+from app.domain.schedules.entities import ScheduleSlot
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.repositories.schedules import SqlAlchemyScheduleRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_slots_cache(
+    session_factory: async_sessionmaker[AsyncSession],
+    cache: RedisCache,
+    days: int,
+    batch_size: int = 500,
+    concurrency: int = 4,
+) -> int:
+    """Preload per-provider slot lists for the next ``days`` days; returns lists written.
+
+    All-provider day listings are cached page by page on demand, so there is no whole-day list to preload.
+    """
+    starts_from = datetime.combine(datetime.now(UTC).date(), time.min, tzinfo=UTC)
+    async with session_factory() as session:
+        slots = await SqlAlchemyScheduleRepository(session).list_available_between(
+            starts_from, starts_from + timedelta(days=days)
+        )
+
+    lists: dict[tuple[UUID | None, date], list[ScheduleSlot]] = defaultdict(list)
+    # Date ranges are composed from per-day lists, so empty days are worth caching too.
+    window = [starts_from.date() + timedelta(days=offset) for offset in range(days)]
+    for provider_id in {slot.provider_id for slot in slots}:
+        for day in window:
+            lists[(provider_id, day)] = []
+    for slot in slots:
+        lists[(slot.provider_id, slot.day)].append(slot)
+    entries = [(provider_id, day, day_slots) for (provider_id, day), day_slots in lists.items()]
+    batches = [entries[i : i + batch_size] for i in range(0, len(entries), batch_size)]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    written = 0
+
+    async def _write(batch: list[tuple[UUID | None, date, list[ScheduleSlot]]]) -> None:
+        nonlocal written
+        async with semaphore:
+            await cache.set_slots_many(batch)
+        written += len(batch)
+        logger.info("Slot cache warm-up: %s/%s lists written", written, len(entries))
+
+    await asyncio.gather(*(_write(batch) for batch in batches))
+    logger.info("Slot cache warm-up finished: %s slots in %s lists", len(slots), len(entries))
+    return written
+
+
+async def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Preload upcoming slot lists into Redis")
+    parser.add_argument("--days", type=int, default=settings.redis.warmup_days)
+    parser.add_argument("--batch-size", type=int, default=settings.redis.warmup_batch_size)
+    parser.add_argument("--concurrency", type=int, default=settings.redis.warmup_concurrency)
+    args = parser.parse_args()
+
+    setup_logging(settings.log_level)
+    engine = create_engine(settings.db.url, settings.db)
+    redis = Redis.from_url(settings.redis.url, decode_responses=False)
+    try:
+        await warm_slots_cache(
+            create_session_factory(engine),
+            RedisCache(redis, settings.redis),
+            days=args.days,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+    finally:
+        await redis.close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,26 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum, ForeignKey, Numeric, String
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    Computed,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Identity,
+    Index,
+    Numeric,
+    String,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSTZRANGE, ExcludeConstraint, Range
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +52,12 @@ class ServiceModel(Base):
 
     provider: Mapped[UserModel] = relationship("UserModel", back_populates="services")
 
+    # Keyset pagination walks (title, id); the provider index also serves the foreign key.
+    __table_args__ = (
+        Index("ix_services_provider_id_title_id", "provider_id", "title", "id"),
+        Index("ix_services_title_id", "title", "id"),
+    )
+
 
 class ScheduleSlotModel(Base):
     __tablename__ = "schedule_slots"
@@ -42,22 +67,73 @@ class ScheduleSlotModel(Base):
     starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     ends_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     is_available: Mapped[bool] = mapped_column(Boolean, default=True)
+    # UTC calendar day of starts_at; the day bucket that date filters and per-day cache lists use.
+    slot_date: Mapped[date] = mapped_column(
+        Date, Computed("(starts_at AT TIME ZONE 'UTC')::date", persisted=True), nullable=False, deferred=True
+    )
+    period: Mapped[Range[datetime]] = mapped_column(
+        TSTZRANGE, Computed("tstzrange(starts_at, ends_at, '[)')", persisted=True), nullable=False, deferred=True
+    )
 
     __table_args__ = (
         CheckConstraint("ends_at > starts_at", name="chk_slot_time"),
+        # A provider's slots never overlap; the GiST index behind it also serves window lookups.
+        ExcludeConstraint(
+            ("provider_id", "="), ("period", "&&"), name="excl_schedule_slots_provider_period", using="gist"
+        ),
+        Index(
+            "ix_schedule_slots_available_provider_starts_at_id",
+            "provider_id",
+            "starts_at",
+            "id",
+            postgresql_where=text("is_available"),
+        ),
+        Index(
+            "ix_schedule_slots_available_starts_at_id", "starts_at", "id", postgresql_where=text("is_available")
+        ),
+        Index(
+            "ix_schedule_slots_available_provider_date",
+            "provider_id",
+            "slot_date",
+            "starts_at",
+            "id",
+            postgresql_where=text("is_available"),
+        ),
+        Index(
+            "ix_schedule_slots_available_date", "slot_date", "starts_at", "id", postgresql_where=text("is_available")
+        ),
     )
 
 
+# The exclusion constraint compares uuids with "=" inside a GiST index.
+event.listen(ScheduleSlotModel.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+
+
 class AppointmentModel(Base):
     __tablename__ = "appointments"
 
     id: Mapped["UUID"] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    client_id: Mapped["UUID"] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    provider_id: Mapped["UUID"] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    client_id: Mapped["UUID"] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    provider_id: Mapped["UUID"] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+    )
     service_id: Mapped["UUID"] = mapped_column(PGUUID(as_uuid=True), ForeignKey("services.id"), nullable=False)
-    slot_id: Mapped["UUID"] = mapped_column(PGUUID(as_uuid=True), ForeignKey("schedule_slots.id"), nullable=False)
+    slot_id: Mapped["UUID"] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("schedule_slots.id"), nullable=False, index=True
+    )
     status: Mapped[AppointmentStatus] = mapped_column(
         Enum(AppointmentStatus, name="appointment_status"), default=AppointmentStatus.created
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
+
+class OutboxModel(Base):
+    """Events committed with the change that caused them, waiting for the relay to publish them."""
+
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    routing_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    headers: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
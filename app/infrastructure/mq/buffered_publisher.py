@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+import logging
+from typing import Any
+
+from app.application.interfaces.mq import EventPublisher
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+dispatch_failures = registry.counter("event_dispatch_failures_total", "Background event publishes that failed")
+dispatch_inline = registry.counter(
+    "event_dispatch_inline_total", "Events published inline because the dispatch queue was full or closed"
+)
+
+Event = tuple[str, dict, dict | None]
+
+
+class BufferedEventPublisher(EventPublisher):
+    """Publishes in the background so requests don't wait on the broker.
+
+    Events go into a bounded queue that one task drains in micro-batches. When the queue is
+    full, ``publish`` waits up to ``enqueue_timeout`` for room and then publishes inline: a slow
+    broker slows requests down instead of growing memory or dropping events. Events still
+    queued when the process is killed are lost; the outbox covers that case.
+    """
+
+    def __init__(self, inner: EventPublisher, queue_size: int, batch_size: int, enqueue_timeout: float = 0.05):
+        self.inner = inner
+        self.batch_size = max(batch_size, 1)
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=queue_size)
+        self._drainer: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._drainer = asyncio.create_task(self._drain())
+
+    async def publish(self, routing_key: str, payload: dict, headers: dict | None = None) -> None:
+        if self._drainer is not None and not self._drainer.done():
+            try:
+                await asyncio.wait_for(self._queue.put((routing_key, payload, headers)), self.enqueue_timeout)
+                return
+            except TimeoutError:
+                pass
+        dispatch_inline.inc()
+        await self.inner.publish(routing_key, payload, headers)
+
+    async def aclose(self, timeout: float = 10.0) -> None:
+        """Flush what is queued, waiting at most ``timeout`` seconds, then stop the drain task."""
+        if self._drainer is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            logger.warning("Event dispatch queue not flushed on shutdown, %s events lost", self._queue.qsize())
+        self._drainer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._drainer
+        self._drainer = None
+
+    async def _drain(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._publish_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _publish_batch(self, batch: list[Event]) -> None:
+        results: list[Any] = await asyncio.gather(
+            *(self.inner.publish(routing_key, payload, headers) for routing_key, payload, headers in batch),
+            return_exceptions=True,
+        )
+        for (routing_key, _, _), result in zip(batch, results, strict=True):
+            if isinstance(result, Exception):
+                dispatch_failures.inc(routing_key=routing_key)
+                logger.error("Background publish of %s failed: %s", routing_key, result)
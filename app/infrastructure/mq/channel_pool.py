@@ -0,0 +1,57 @@
+import asyncio
+import logging
+
+from aio_pika import Message
+from aio_pika.abc import AbstractChannel, AbstractConnection
+from aio_pika.exceptions import AMQPChannelError, ChannelInvalidStateError
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelPool:
+    """Long-lived publisher channels with confirms, shared round-robin by concurrent publishes.
+
+    Confirms are tracked per delivery tag, so any number of publishes can wait for their
+    acks on the same channel at once. A channel that the broker closed is replaced on next use.
+    """
+
+    def __init__(self, connection: AbstractConnection, size: int):
+        self.connection = connection
+        self.size = max(size, 1)
+        self._channels: list[AbstractChannel | None] = [None] * self.size
+        self._opening = [asyncio.Lock() for _ in range(self.size)]
+        self._next = 0
+
+    async def acquire(self) -> AbstractChannel:
+        index = self._next
+        self._next = (index + 1) % self.size
+        channel = self._channels[index]
+        if channel is not None and not channel.is_closed:
+            return channel
+        async with self._opening[index]:
+            channel = self._channels[index]
+            if channel is None or channel.is_closed:
+                channel = await self.connection.channel(publisher_confirms=True)
+                self._channels[index] = channel
+            return channel
+
+    async def publish(self, message: Message, routing_key: str) -> None:
+        """Publish and wait for the broker confirm; retried once on a fresh channel after a channel error."""
+        channel = await self.acquire()
+        try:
+            await channel.default_exchange.publish(message, routing_key=routing_key)
+            return
+        except (AMQPChannelError, ChannelInvalidStateError) as exc:
+            logger.warning("Publisher channel failed, replacing it: %s", exc)
+            self._discard(channel)
+        channel = await self.acquire()
+        await channel.default_exchange.publish(message, routing_key=routing_key)
+
+    async def close(self) -> None:
+        channels = [channel for channel in self._channels if channel is not None and not channel.is_closed]
+        self._channels = [None] * self.size
+        for channel in channels:
+            await channel.close()
+
+    def _discard(self, channel: AbstractChannel) -> None:
+        self._channels = [None if item is channel else item for item in self._channels]
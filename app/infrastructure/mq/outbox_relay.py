@@ -0,0 +1,94 @@
+"""Publishes events from the outbox table to RabbitMQ.
+
+Run as ``python -m app.infrastructure.mq.outbox_relay``. Several relays can run side by side:
+each claims its own rows with ``FOR UPDATE SKIP LOCKED``. Delivery is at least once, since a relay
+that dies after publishing but before its transaction commits leaves the rows for the next claim.
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.interfaces.mq import EventPublisher as EventPublisherProtocol
+from app.core.config import get_settings
+from app.core.db import create_engine, create_session_factory
+from app.core.logging import setup_logging
+from app.infrastructure.mq.channel_pool import ChannelPool
+from app.infrastructure.mq.publisher import EventPublisher, create_rabbit_connection
+from app.infrastructure.repositories.outbox import SqlAlchemyOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def relay_batch(
+    session_factory: async_sessionmaker[AsyncSession], publisher: EventPublisherProtocol, batch_size: int
+) -> int:
+    """Publish one batch of pending events and delete the confirmed ones; returns how many were published."""
+    async with session_factory() as session, session.begin():
+        outbox = SqlAlchemyOutboxRepository(session)
+        rows = await outbox.claim(batch_size)
+        if not rows:
+            return 0
+        # Publishes share the pool's confirm channels, so the whole batch waits for its acks together.
+        results = await asyncio.gather(
+            *(publisher.publish(routing_key, payload, headers) for _, routing_key, payload, headers in rows),
+            return_exceptions=True,
+        )
+        published = [row[0] for row, result in zip(rows, results, strict=True) if not isinstance(result, BaseException)]
+        if len(published) < len(rows):
+            errors = [result for result in results if isinstance(result, BaseException)]
+            logger.warning("Outbox relay: %s of %s events failed to publish: %s", len(errors), len(rows), errors[0])
+        if published:
+            await outbox.delete(published)
+        return len(published)
+
+
+async def run_relay(
+    session_factory: async_sessionmaker[AsyncSession],
+    publisher: EventPublisherProtocol,
+    batch_size: int,
+    poll_interval: float,
+    stop: asyncio.Event,
+) -> None:
+    while not stop.is_set():
+        try:
+            published = await relay_batch(session_factory, publisher, batch_size)
+        except Exception as exc:
+            logger.warning("Outbox relay batch failed: %s", exc)
+            published = 0
+        # A full batch means more is probably waiting; otherwise back off until the next poll.
+        if published < batch_size:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), poll_interval)
+
+
+async def main() -> None:
+    settings = get_settings()
+    setup_logging(settings.log_level)
+    engine = create_engine(settings.db.url, settings.db)
+    connection = await create_rabbit_connection(settings.rabbit.url)
+    channels = ChannelPool(connection, settings.rabbit.publisher_channels)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+    try:
+        await run_relay(
+            create_session_factory(engine),
+            EventPublisher(channels, settings.rabbit),
+            batch_size=settings.rabbit.outbox_batch_size,
+            poll_interval=settings.rabbit.outbox_poll_interval_seconds,
+            stop=stop,
+        )
+    finally:
+        await channels.close()
+        await connection.close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
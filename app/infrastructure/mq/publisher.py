@@ -7,6 +7,7 @@ from aio_pika import Message, RobustConnection
 
 from app.application.interfaces.mq import EventPublisher as EventPublisherProtocol
 from app.core.config import RabbitSettings
+from app.infrastructure.mq.channel_pool import ChannelPool
 
 DEBUG_LOG_PATH = "/Users/vladislavargun/Documents/GitHub/Cursor/Appointment Hub/.cursor/debug.log"
 
@@ -31,14 +32,13 @@ def _debug_log(hypothesis_id: str, message: str, data: dict) -> None:
 
 
 class EventPublisher(EventPublisherProtocol):
-    def __init__(self, connection: RobustConnection, settings: RabbitSettings):
-        self.connection = connection
+    def __init__(self, channels: ChannelPool, settings: RabbitSettings):
+        self.channels = channels
         self.settings = settings
 
     async def publish(self, routing_key: str, payload: dict, headers: dict | None = None) -> None:
         target_routing = self.settings.notifications_queue or routing_key
-        channel = await self.connection.channel()
-        await channel.default_exchange.publish(
+        await self.channels.publish(
             Message(
                 body=json.dumps(payload).encode(),
                 headers=headers or {},
@@ -46,7 +46,6 @@ class EventPublisher(EventPublisherProtocol):
             ),
             routing_key=target_routing,
         )
-        await channel.close()
 
 
 async def create_rabbit_connection(url: str) -> RobustConnection:
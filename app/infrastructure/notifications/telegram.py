@@ -1,3 +1,4 @@
+import importlib.util
 import logging
 
 import httpx
@@ -7,21 +8,49 @@ from app.core.config import TelegramSettings
 
 logger = logging.getLogger(__name__)
 
+# httpx only speaks HTTP/2 with the optional h2 package installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class TelegramNotifier(Notifier):
+    """Sends messages through one long-lived client, so connections and TLS sessions are reused."""
+
     def __init__(self, settings: TelegramSettings):
         self.settings = settings
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            base_url=self.settings.api_base_url,
+            timeout=self.settings.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_connections,
+            ),
+            http2=HTTP2_AVAILABLE,
+        )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_message(self, text: str) -> bool:
         if not self.settings.bot_token or not self.settings.chat_id:
             logger.error("Telegram credentials missing; notification failed")
             return False
-        url = f"https://api.telegram.org/bot{self.settings.bot_token}/sendMessage"
+        if self._client is None:
+            await self.start()
+        assert self._client
         payload = {"chat_id": self.settings.chat_id, "text": text}
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json=payload)
-            if response.status_code != 200:
-                logger.error("Telegram API error %s: %s", response.status_code, response.text)
-                return False
+        try:
+            response = await self._client.post(f"/bot{self.settings.bot_token}/sendMessage", json=payload)
+        except httpx.HTTPError as exc:
+            logger.error("Telegram API request failed: %s", exc)
+            return False
+        if response.status_code != 200:
+            logger.error("Telegram API error %s: %s", response.status_code, response.text)
+            return False
         return True
-
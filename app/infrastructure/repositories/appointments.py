@@ -1,13 +1,19 @@
-from uuid import UUID
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.appointments.entities import Appointment, AppointmentStatus
-from app.infrastructure.db.models import AppointmentModel
+from app.domain.schedules.entities import ScheduleSlot
+from app.infrastructure.db.models import AppointmentModel, ScheduleSlotModel
 
 
-def _to_domain(model: AppointmentModel) -> Appointment:
+def _to_domain(model: AppointmentModel | Row[Any]) -> Appointment:
     return Appointment(
         id=model.id,
         client_id=model.client_id,
@@ -19,6 +25,20 @@ def _to_domain(model: AppointmentModel) -> Appointment:
     )
 
 
+def _booked_slot(row: Row[Any]) -> ScheduleSlot:
+    return ScheduleSlot(
+        id=row.slot_id,
+        provider_id=row.slot_provider_id,
+        starts_at=row.starts_at,
+        ends_at=row.ends_at,
+        is_available=False,
+    )
+
+
+def _freed_slot(row: Row[Any]) -> ScheduleSlot:
+    return _booked_slot(row).model_copy(update={"is_available": True})
+
+
 class SqlAlchemyAppointmentRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -31,17 +51,186 @@ class SqlAlchemyAppointmentRepository:
         slot_id: UUID,
         status: AppointmentStatus = AppointmentStatus.created,
     ) -> Appointment:
-        model = AppointmentModel(
-            client_id=client_id,
-            provider_id=provider_id,
-            service_id=service_id,
-            slot_id=slot_id,
-            status=status,
-        )
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return _to_domain(model)
+        appointments = AppointmentModel.__table__
+        stmt = (
+            insert(appointments)
+            .values(
+                id=uuid4(),
+                client_id=client_id,
+                provider_id=provider_id,
+                service_id=service_id,
+                slot_id=slot_id,
+                status=status,
+                created_at=datetime.now(UTC),
+            )
+            .returning(*appointments.c)
+        )
+        result = await self.session.execute(stmt)
+        return _to_domain(result.one())
+
+    async def book(
+        self,
+        client_id: UUID,
+        provider_id: UUID,
+        service_id: UUID,
+        slot_id: UUID,
+        status: AppointmentStatus = AppointmentStatus.created,
+    ) -> tuple[Appointment, ScheduleSlot] | None:
+        """Claim the slot and insert the appointment in one statement; None if the slot is taken."""
+        slots = ScheduleSlotModel.__table__
+        appointments = AppointmentModel.__table__
+        # The conditional UPDATE is the lock: a concurrent booking blocks on the row, then sees
+        # is_available = false and claims nothing, so its INSERT selects no rows.
+        booked = (
+            update(slots)
+            .where(slots.c.id == slot_id, slots.c.is_available)
+            .values(is_available=False)
+            .returning(slots.c.id, slots.c.provider_id, slots.c.starts_at, slots.c.ends_at)
+            .cte("booked")
+        )
+        inserted = (
+            insert(appointments)
+            .from_select(
+                ["id", "client_id", "provider_id", "service_id", "slot_id", "status", "created_at"],
+                select(
+                    literal(uuid4(), appointments.c.id.type),
+                    literal(client_id, appointments.c.client_id.type),
+                    literal(provider_id, appointments.c.provider_id.type),
+                    literal(service_id, appointments.c.service_id.type),
+                    booked.c.id,
+                    literal(status, appointments.c.status.type),
+                    literal(datetime.now(UTC), appointments.c.created_at.type),
+                ),
+            )
+            .returning(*appointments.c)
+            .cte("inserted")
+        )
+        stmt = select(
+            inserted,
+            booked.c.provider_id.label("slot_provider_id"),
+            booked.c.starts_at,
+            booked.c.ends_at,
+        ).join_from(inserted, booked, inserted.c.slot_id == booked.c.id)
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return _to_domain(row), _booked_slot(row)
+
+    async def book_many(
+        self,
+        client_id: UUID,
+        provider_id: UUID,
+        service_id: UUID,
+        slot_ids: Sequence[UUID],
+        status: AppointmentStatus = AppointmentStatus.created,
+    ) -> list[tuple[Appointment, ScheduleSlot]] | None:
+        """Claim every slot and insert one appointment per slot; None, with nothing written, if any is taken."""
+        slots = ScheduleSlotModel.__table__
+        appointments = AppointmentModel.__table__
+        ids = sorted(set(slot_ids))
+        # Locking in id order means two overlapping batches queue up instead of deadlocking.
+        locked = await self.session.execute(
+            select(slots.c.id).where(slots.c.id.in_(ids), slots.c.is_available).order_by(slots.c.id).with_for_update()
+        )
+        if len(locked.all()) != len(ids):
+            return None
+
+        booked = (
+            update(slots)
+            .where(slots.c.id.in_(ids), slots.c.is_available)
+            .values(is_available=False)
+            .returning(slots.c.id, slots.c.provider_id, slots.c.starts_at, slots.c.ends_at)
+            .cte("booked")
+        )
+        requested = (
+            func.unnest(
+                bindparam("slot_ids", ids, type_=ARRAY(PGUUID(as_uuid=True))),
+                bindparam("appointment_ids", [uuid4() for _ in ids], type_=ARRAY(PGUUID(as_uuid=True))),
+            )
+            .table_valued("slot_id", "id")
+            .render_derived("requested")
+        )
+        inserted = (
+            insert(appointments)
+            .from_select(
+                ["id", "client_id", "provider_id", "service_id", "slot_id", "status", "created_at"],
+                select(
+                    requested.c.id,
+                    literal(client_id, appointments.c.client_id.type),
+                    literal(provider_id, appointments.c.provider_id.type),
+                    literal(service_id, appointments.c.service_id.type),
+                    booked.c.id,
+                    literal(status, appointments.c.status.type),
+                    literal(datetime.now(UTC), appointments.c.created_at.type),
+                ).join_from(booked, requested, requested.c.slot_id == booked.c.id),
+            )
+            .returning(*appointments.c)
+            .cte("inserted")
+        )
+        stmt = (
+            select(
+                inserted,
+                booked.c.provider_id.label("slot_provider_id"),
+                booked.c.starts_at,
+                booked.c.ends_at,
+            )
+            .join_from(inserted, booked, inserted.c.slot_id == booked.c.id)
+            .order_by(booked.c.starts_at)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [(_to_domain(row), _booked_slot(row)) for row in rows]
+
+    async def cancel_many(
+        self,
+        provider_id: UUID | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        appointment_ids: Sequence[UUID] | None = None,
+    ) -> list[tuple[Appointment, ScheduleSlot]]:
+        """Cancel every matching active appointment and free its slot in one statement.
+
+        Dates filter on the slot's UTC day, inclusive on both ends.
+        """
+        slots = ScheduleSlotModel.__table__
+        appointments = AppointmentModel.__table__
+        conditions = [
+            appointments.c.slot_id == slots.c.id,
+            appointments.c.status != AppointmentStatus.cancelled,
+        ]
+        if provider_id is not None:
+            conditions.append(appointments.c.provider_id == provider_id)
+        if date_from is not None:
+            conditions.append(slots.c.slot_date >= date_from)
+        if date_to is not None:
+            conditions.append(slots.c.slot_date <= date_to)
+        if appointment_ids is not None:
+            conditions.append(appointments.c.id.in_(appointment_ids))
+        cancelled = (
+            update(appointments)
+            .where(*conditions)
+            .values(status=AppointmentStatus.cancelled)
+            .returning(*appointments.c)
+            .cte("cancelled")
+        )
+        freed = (
+            update(slots)
+            .where(slots.c.id == cancelled.c.slot_id)
+            .values(is_available=True)
+            .returning(slots.c.id, slots.c.provider_id, slots.c.starts_at, slots.c.ends_at)
+            .cte("freed")
+        )
+        stmt = (
+            select(
+                cancelled,
+                freed.c.provider_id.label("slot_provider_id"),
+                freed.c.starts_at,
+                freed.c.ends_at,
+            )
+            .join_from(cancelled, freed, cancelled.c.slot_id == freed.c.id)
+            .order_by(freed.c.starts_at, cancelled.c.id)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [(_to_domain(row), _freed_slot(row)) for row in rows]
 
     async def get(self, appointment_id: UUID) -> Appointment | None:
         stmt = select(AppointmentModel).where(AppointmentModel.id == appointment_id)
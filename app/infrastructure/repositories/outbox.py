@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.models import OutboxModel
+
+_outbox = OutboxModel.__table__
+
+OutboxRow = tuple[int, str, dict[str, Any], dict[str, Any]]
+
+
+class SqlAlchemyOutboxRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, routing_key: str, payload: dict, headers: dict | None = None) -> None:
+        await self.session.execute(insert(_outbox).values(routing_key=routing_key, payload=payload, headers=headers or {}))
+
+    async def claim(self, limit: int) -> Sequence[OutboxRow]:
+        """Lock the oldest pending events; rows locked by another relay are skipped, not waited for."""
+        stmt = (
+            select(_outbox.c.id, _outbox.c.routing_key, _outbox.c.payload, _outbox.c.headers)
+            .order_by(_outbox.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return (await self.session.execute(stmt)).tuples().all()
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        await self.session.execute(delete(_outbox).where(_outbox.c.id.in_(ids)))
@@ -1,15 +1,26 @@
 from collections.abc import Sequence
-from datetime import date, datetime, timedelta
-from uuid import UUID
+from datetime import UTC, date, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, Row, Select, bindparam, func, literal, select, true, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.pagination import SlotCursor
 from app.domain.schedules.entities import ScheduleSlot
 from app.infrastructure.db.models import ScheduleSlotModel
 
+OVERLAP_CONSTRAINT = "excl_schedule_slots_provider_period"
 
-def _to_domain(model: ScheduleSlotModel) -> ScheduleSlot:
+_slots = ScheduleSlotModel.__table__
+# Generated columns stay in the database; nothing in the domain reads them back.
+SLOT_COLUMNS = (_slots.c.id, _slots.c.provider_id, _slots.c.starts_at, _slots.c.ends_at, _slots.c.is_available)
+SlotRow = tuple[UUID, UUID, datetime, datetime, bool]
+
+
+def _to_domain(model: ScheduleSlotModel | Row[Any]) -> ScheduleSlot:
     return ScheduleSlot(
         id=model.id,
         provider_id=model.provider_id,
@@ -19,31 +30,139 @@ def _to_domain(model: ScheduleSlotModel) -> ScheduleSlot:
     )
 
 
+def _from_row(row: SlotRow) -> ScheduleSlot:
+    # Rows come straight from our own table, so validation would only re-check what the schema guarantees.
+    slot_id, provider_id, starts_at, ends_at, is_available = row
+    return ScheduleSlot.model_construct(
+        id=slot_id, provider_id=provider_id, starts_at=starts_at, ends_at=ends_at, is_available=is_available
+    )
+
+
+def available_slots_query(
+    provider_id: UUID | None,
+    date_filter: date | None,
+    after: SlotCursor | None = None,
+    limit: int | None = None,
+    until: date | None = None,
+) -> Select[SlotRow]:
+    """Available slots ordered by (starts_at, id); ``until`` turns ``date_filter`` into an inclusive day range."""
+    stmt = select(*SLOT_COLUMNS)
+    if provider_id:
+        stmt = stmt.where(_slots.c.provider_id == provider_id)
+    if date_filter:
+        # slot_date is the UTC day of starts_at, so leading with it keeps the (starts_at, id) order
+        # while a day range can walk the (slot_date, starts_at, id) indexes instead of sorting.
+        keys: tuple[Any, ...] = (_slots.c.slot_date, _slots.c.starts_at, _slots.c.id)
+        stmt = stmt.where(_slots.c.slot_date.between(date_filter, until or date_filter))
+    else:
+        keys = (_slots.c.starts_at, _slots.c.id)
+    if after:
+        position = (after[0].astimezone(UTC).date(), *after) if date_filter else after
+        stmt = stmt.where(tuple_(*keys) > tuple_(*(literal(value) for value in position)))
+    # Plain boolean predicate so the planner can match the partial "WHERE is_available" indexes.
+    stmt = stmt.where(_slots.c.is_available).order_by(*keys)
+    return stmt.limit(limit) if limit else stmt
+
+
+def available_slots_on_query(provider_id: UUID | None, days: Sequence[date]) -> Select[SlotRow]:
+    stmt = select(*SLOT_COLUMNS).where(_slots.c.slot_date.in_(days), _slots.c.is_available)
+    if provider_id:
+        stmt = stmt.where(_slots.c.provider_id == provider_id)
+    return stmt.order_by(_slots.c.starts_at, _slots.c.id)
+
+
+def overlapping_slots_query(
+    provider_id: UUID, starts_at: datetime, ends_at: datetime
+) -> Select[tuple[ScheduleSlotModel]]:
+    window = func.tstzrange(starts_at, ends_at, "[)")
+    return (
+        select(ScheduleSlotModel)
+        .where(ScheduleSlotModel.provider_id == provider_id, ScheduleSlotModel.period.overlaps(window))
+        .order_by(ScheduleSlotModel.starts_at, ScheduleSlotModel.id)
+    )
+
+
 class SqlAlchemyScheduleRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create_slot(self, provider_id: UUID, starts_at: datetime, ends_at: datetime) -> ScheduleSlot:
-        model = ScheduleSlotModel(provider_id=provider_id, starts_at=starts_at, ends_at=ends_at)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return _to_domain(model)
+    async def create_slot(self, provider_id: UUID, starts_at: datetime, ends_at: datetime) -> ScheduleSlot | None:
+        """Insert a slot; returns None when it overlaps another slot of the provider."""
+        slots = ScheduleSlotModel.__table__
+        stmt = (
+            insert(slots)
+            .values(id=uuid4(), provider_id=provider_id, starts_at=starts_at, ends_at=ends_at, is_available=True)
+            .on_conflict_do_nothing(constraint=OVERLAP_CONSTRAINT)
+            .returning(*SLOT_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return _to_domain(row) if row else None
 
-    async def list_available(self, provider_id: UUID | None, date_filter: date | None) -> Sequence[ScheduleSlot]:
-        stmt = select(ScheduleSlotModel)
-        if provider_id:
-            stmt = stmt.where(ScheduleSlotModel.provider_id == provider_id)
-        if date_filter:
-            next_day = date_filter + timedelta(days=1)
-            stmt = stmt.where(
-                ScheduleSlotModel.starts_at >= datetime.combine(date_filter, datetime.min.time()),
-                ScheduleSlotModel.starts_at < datetime.combine(next_day, datetime.min.time()),
-            )
-        stmt = stmt.where(ScheduleSlotModel.is_available.is_(True))
+    async def create_slots(
+        self, provider_id: UUID, windows: Sequence[tuple[datetime, datetime]]
+    ) -> Sequence[ScheduleSlot] | None:
+        """Insert all windows in one statement, or nothing (returns None) if any overlaps an existing slot."""
+        slots = ScheduleSlotModel.__table__
+        # Whole windows travel as three array parameters, whatever the batch size.
+        unnest = func.unnest(
+            bindparam("ids", [uuid4() for _ in windows], type_=ARRAY(PGUUID(as_uuid=True))),
+            bindparam("starts", [starts_at for starts_at, _ in windows], type_=ARRAY(DateTime(timezone=True))),
+            bindparam("ends", [ends_at for _, ends_at in windows], type_=ARRAY(DateTime(timezone=True))),
+        ).table_valued("id", "starts_at", "ends_at")
+        batch = unnest.render_derived("batch")
+        probe = unnest.render_derived("probe")
+        overlap = (
+            select(literal(1))
+            .select_from(slots)
+            .join(probe, slots.c.period.overlaps(func.tstzrange(probe.c.starts_at, probe.c.ends_at, "[)")))
+            .where(slots.c.provider_id == provider_id)
+            .exists()
+        )
+        rows = select(
+            batch.c.id, literal(provider_id, PGUUID(as_uuid=True)), batch.c.starts_at, batch.c.ends_at, true()
+        ).where(~overlap)
+        # The probe keeps the batch all-or-nothing; the constraint settles races with concurrent writers,
+        # in which case part of the batch is skipped and the caller must roll back.
+        stmt = (
+            insert(slots)
+            .from_select(["id", "provider_id", "starts_at", "ends_at", "is_available"], rows)
+            .on_conflict_do_nothing(constraint=OVERLAP_CONSTRAINT)
+            .returning(*SLOT_COLUMNS)
+        )
         result = await self.session.execute(stmt)
+        created = [_to_domain(row) for row in result.all()]
+        return created if len(created) == len(windows) else None
+
+    async def list_overlapping(self, provider_id: UUID, starts_at: datetime, ends_at: datetime) -> Sequence[ScheduleSlot]:
+        """All slots of the provider, booked or not, that intersect ``[starts_at, ends_at)``."""
+        result = await self.session.execute(overlapping_slots_query(provider_id, starts_at, ends_at))
         return [_to_domain(model) for model in result.scalars().all()]
 
+    async def list_available(
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        after: SlotCursor | None = None,
+        limit: int | None = None,
+        until: date | None = None,
+    ) -> Sequence[ScheduleSlot]:
+        result = await self.session.execute(available_slots_query(provider_id, date_filter, after, limit, until))
+        return [_from_row(row) for row in result.tuples()]
+
+    async def list_available_on(self, provider_id: UUID | None, days: Sequence[date]) -> Sequence[ScheduleSlot]:
+        result = await self.session.execute(available_slots_on_query(provider_id, days))
+        return [_from_row(row) for row in result.tuples()]
+
+    async def list_available_between(self, starts_from: datetime, until: datetime) -> Sequence[ScheduleSlot]:
+        stmt = (
+            select(*SLOT_COLUMNS)
+            .where(_slots.c.starts_at >= starts_from, _slots.c.starts_at < until, _slots.c.is_available)
+            .order_by(_slots.c.starts_at, _slots.c.id)
+        )
+        result = await self.session.execute(stmt)
+        return [_from_row(row) for row in result.tuples()]
+
     async def mark_slot_availability(self, slot_id: UUID, is_available: bool) -> ScheduleSlot | None:
         stmt = select(ScheduleSlotModel).where(ScheduleSlotModel.id == slot_id).with_for_update()
         result = await self.session.execute(stmt)
@@ -54,9 +173,3 @@ class SqlAlchemyScheduleRepository:
         await self.session.flush()
         return _to_domain(model)
 
-    async def lock_slot(self, slot_id: UUID) -> ScheduleSlot | None:
-        stmt = select(ScheduleSlotModel).where(ScheduleSlotModel.id == slot_id).with_for_update()
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return _to_domain(model) if model else None
-
@@ -1,14 +1,17 @@
 from collections.abc import Sequence
-from uuid import UUID
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import Row, insert, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.pagination import ServiceCursor
 from app.domain.services.entities import Service
 from app.infrastructure.db.models import ServiceModel
 
 
-def _to_domain(model: ServiceModel) -> Service:
+def _to_domain(model: ServiceModel | Row[Any]) -> Service:
     return Service(
         id=model.id,
         provider_id=model.provider_id,
@@ -18,21 +21,49 @@ def _to_domain(model: ServiceModel) -> Service:
     )
 
 
+_services = ServiceModel.__table__
+SERVICE_COLUMNS = (
+    _services.c.id,
+    _services.c.provider_id,
+    _services.c.title,
+    _services.c.duration_min,
+    _services.c.price,
+)
+
+
+def _from_row(row: tuple[UUID, UUID, str, int, Decimal]) -> Service:
+    # Trusted rows from our own table: skip per-row validation.
+    service_id, provider_id, title, duration_min, price = row
+    return Service.model_construct(
+        id=service_id, provider_id=provider_id, title=title, duration_min=duration_min, price=float(price)
+    )
+
+
 class SqlAlchemyServiceRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def list(self, provider_id: UUID | None = None) -> Sequence[Service]:
-        stmt = select(ServiceModel)
+    async def list(
+        self, provider_id: UUID | None = None, after: ServiceCursor | None = None, limit: int | None = None
+    ) -> Sequence[Service]:
+        stmt = select(*SERVICE_COLUMNS).order_by(_services.c.title, _services.c.id)
         if provider_id:
-            stmt = stmt.where(ServiceModel.provider_id == provider_id)
+            stmt = stmt.where(_services.c.provider_id == provider_id)
+        if after:
+            position = tuple_(*(literal(value) for value in after))
+            stmt = stmt.where(tuple_(_services.c.title, _services.c.id) > position)
+        if limit:
+            stmt = stmt.limit(limit)
         result = await self.session.execute(stmt)
-        return [_to_domain(model) for model in result.scalars().all()]
+        return [_from_row(row) for row in result.tuples()]
 
     async def create(self, provider_id: UUID, title: str, duration_min: int, price: float) -> Service:
-        model = ServiceModel(provider_id=provider_id, title=title, duration_min=duration_min, price=price)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return _to_domain(model)
+        services = ServiceModel.__table__
+        stmt = (
+            insert(services)
+            .values(id=uuid4(), provider_id=provider_id, title=title, duration_min=duration_min, price=price)
+            .returning(*services.c)
+        )
+        result = await self.session.execute(stmt)
+        return _to_domain(result.one())
 
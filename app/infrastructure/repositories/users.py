@@ -1,13 +1,15 @@
-from uuid import UUID
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.users.entities import User, UserRole
 from app.infrastructure.db.models import UserModel
 
 
-def _to_domain(model: UserModel) -> User:
+def _to_domain(model: UserModel | Row[Any]) -> User:
     return User(
         id=model.id,
         email=model.email,
@@ -22,11 +24,14 @@ class SqlAlchemyUserRepository:
         self.session = session
 
     async def create(self, email: str, full_name: str, role: UserRole) -> User:
-        model = UserModel(email=email, full_name=full_name, role=role)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return _to_domain(model)
+        users = UserModel.__table__
+        stmt = (
+            insert(users)
+            .values(id=uuid4(), email=email, full_name=full_name, role=role, created_at=datetime.now(UTC))
+            .returning(*users.c)
+        )
+        result = await self.session.execute(stmt)
+        return _to_domain(result.one())
 
     async def get(self, user_id: UUID) -> User | None:
         stmt = select(UserModel).where(UserModel.id == user_id)
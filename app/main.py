@@ -4,12 +4,19 @@ from fastapi import FastAPI
 from redis.asyncio import Redis
 
 from app.api.v1.router import api_router
-from app.api.v1.routes import health
+from app.api.v1.routes import health, metrics
+from app.application.single_flight import SingleFlight
 from app.core import context
 from app.core.config import get_settings
-from app.core.db import create_engine, create_session_factory
+from app.core.db import ReplicaRouter, create_engine, create_session_factory, instrument_pool
 from app.core.logging import setup_logging
+from app.infrastructure.cache.instrumented import CacheMetrics, InstrumentedCache
+from app.infrastructure.cache.local_cache import LocalCache
 from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.redis_lock import RedisLock
+from app.infrastructure.cache.warmup import warm_slots_cache
+from app.infrastructure.mq.buffered_publisher import BufferedEventPublisher
+from app.infrastructure.mq.channel_pool import ChannelPool
 from app.infrastructure.mq.publisher import EventPublisher, create_rabbit_connection
 
 logger = logging.getLogger(__name__)
@@ -24,21 +31,79 @@ context.app_context = app_context
 
 @app.on_event("startup")
 async def on_startup() -> None:
-    app_context.engine = create_engine(settings.db.url)
+    app_context.engine = create_engine(settings.db.url, settings.db)
     app_context.session_factory = create_session_factory(app_context.engine)
+    engines = {"primary": app_context.engine}
+    if settings.db.replica_urls:
+        replicas = [
+            create_engine(url, settings.db, name=f"replica{index}") for index, url in enumerate(settings.db.replica_urls)
+        ]
+        engines.update((f"replica{index}", engine) for index, engine in enumerate(replicas))
+        app_context.replicas = ReplicaRouter(
+            app_context.session_factory,
+            replicas,
+            max_lag_seconds=settings.db.replica_max_lag_seconds,
+            check_interval_seconds=settings.db.replica_check_interval_seconds,
+            clock_skew_seconds=settings.db.replica_clock_skew_seconds,
+        )
+        await app_context.replicas.start()
+    if settings.metrics_enabled:
+        for name, engine in engines.items():
+            instrument_pool(engine, name)
     app_context.redis = Redis.from_url(settings.redis.url, decode_responses=False)
-    app_context.cache = RedisCache(app_context.redis, settings.redis)
+    cache_metrics = CacheMetrics() if settings.metrics_enabled else None
+    redis_cache = RedisCache(app_context.redis, settings.redis, cache_metrics)
+    app_context.cache = redis_cache
+    if settings.redis.warmup_on_startup:
+        try:
+            await warm_slots_cache(
+                app_context.session_factory,
+                redis_cache,
+                days=settings.redis.warmup_days,
+                batch_size=settings.redis.warmup_batch_size,
+                concurrency=settings.redis.warmup_concurrency,
+            )
+        except Exception as exc:  # a cold cache is slower, not broken
+            logger.warning("Slot cache warm-up failed: %s", exc)
+    if settings.redis.local_cache_enabled:
+        local_cache = LocalCache(redis_cache, app_context.redis, settings.redis)
+        await local_cache.start()
+        app_context.local_cache = local_cache
+        app_context.cache = local_cache
+    if cache_metrics:
+        app_context.cache = InstrumentedCache(app_context.cache, cache_metrics)
+    fill_lock = RedisLock(app_context.redis) if settings.redis.fill_lock_enabled else None
+    app_context.single_flight = SingleFlight(fill_lock, lock_ttl_ms=settings.redis.fill_lock_ttl_ms)
     app_context.rabbit_connection = await create_rabbit_connection(settings.rabbit.url)
-    app_context.publisher = EventPublisher(app_context.rabbit_connection, settings.rabbit)
+    app_context.channel_pool = ChannelPool(app_context.rabbit_connection, settings.rabbit.publisher_channels)
+    app_context.publisher = EventPublisher(app_context.channel_pool, settings.rabbit)
+    if settings.rabbit.async_dispatch:
+        app_context.buffered_publisher = BufferedEventPublisher(
+            app_context.publisher,
+            queue_size=settings.rabbit.dispatch_queue_size,
+            batch_size=settings.rabbit.dispatch_batch_size,
+            enqueue_timeout=settings.rabbit.dispatch_enqueue_timeout_seconds,
+        )
+        app_context.buffered_publisher.start()
+        app_context.publisher = app_context.buffered_publisher
     logger.info("Application started")
 
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
+    if app_context.local_cache:
+        await app_context.local_cache.aclose()
     if app_context.redis:
         await app_context.redis.close()
+    # Flush queued events while the channels are still open.
+    if app_context.buffered_publisher:
+        await app_context.buffered_publisher.aclose()
+    if app_context.channel_pool:
+        await app_context.channel_pool.close()
     if app_context.rabbit_connection:
         await app_context.rabbit_connection.close()
+    if app_context.replicas:
+        await app_context.replicas.aclose()
     if app_context.engine:
         await app_context.engine.dispose()
     logger.info("Application shutdown complete")
@@ -46,6 +111,8 @@ async def on_shutdown() -> None:
 
 app.include_router(api_router, prefix=settings.api_prefix)
 app.include_router(health.router, tags=["health"])
+if settings.metrics_enabled:
+    app.include_router(metrics.router, tags=["metrics"])
 
 
 def start() -> None:
@@ -1,9 +1,10 @@
-from collections.abc import Sequence
+import time
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import date
 from typing import Any
 from uuid import UUID
 
-from app.application.interfaces.cache import CacheProvider
+from app.application.interfaces.cache import CacheEntry, CacheProvider
 from app.application.interfaces.mq import EventPublisher
 from app.domain.schedules.entities import ScheduleSlot
 from app.domain.services.entities import Service
@@ -11,30 +12,60 @@ from app.domain.services.entities import Service
 
 class InMemoryCache(CacheProvider):
     def __init__(self):
-        self.services: dict[str, list[Service]] = {}
-        self.slots: dict[str, list[ScheduleSlot]] = {}
+        self.services: dict[tuple, list[Service]] = {}
+        self.slots: dict[tuple, list[ScheduleSlot]] = {}
+        self.invalidations: dict[str, float] = {}
 
-    async def get_services(self, provider_id: UUID | None):
-        return self.services.get(str(provider_id))
+    async def get_services(self, provider_id: UUID | None, after=None, limit: int | None = None):
+        services = self.services.get((provider_id, after, limit))
+        return CacheEntry(services) if services is not None else None
 
-    async def set_services(self, provider_id: UUID | None, services: Sequence[Service]) -> None:
-        self.services[str(provider_id)] = list(services)
+    async def set_services(
+        self, provider_id: UUID | None, services: Sequence[Service], after=None, limit: int | None = None
+    ) -> None:
+        self.services[(provider_id, after, limit)] = list(services)
 
     async def invalidate_services(self) -> None:
         self.services.clear()
+        self.invalidations["services"] = time.time()
 
-    async def get_slots(self, provider_id: UUID | None, date_filter: date | None):
-        key = f"{provider_id}:{date_filter}"
-        return self.slots.get(key)
+    async def get_slots(self, provider_id: UUID | None, date_filter: date | None, after=None, limit: int | None = None):
+        slots = self.slots.get((provider_id, date_filter, after, limit))
+        return CacheEntry(slots) if slots is not None else None
 
     async def set_slots(
-        self, provider_id: UUID | None, date_filter: date | None, slots: Sequence[ScheduleSlot]
+        self,
+        provider_id: UUID | None,
+        date_filter: date | None,
+        slots: Sequence[ScheduleSlot],
+        after=None,
+        limit: int | None = None,
     ) -> None:
-        key = f"{provider_id}:{date_filter}"
-        self.slots[key] = list(slots)
+        self.slots[(provider_id, date_filter, after, limit)] = list(slots)
+
+    async def get_slot_days(self, provider_id: UUID | None, days: Sequence[date]):
+        lists = {day: self.slots.get((provider_id, day, None, None)) for day in days}
+        return {day: CacheEntry(slots) for day, slots in lists.items() if slots is not None}
+
+    async def set_slot_days(self, provider_id: UUID | None, lists: Mapping[date, Sequence[ScheduleSlot]]) -> None:
+        for day, slots in lists.items():
+            self.slots[(provider_id, day, None, None)] = list(slots)
+
+    async def invalidate_slots(self, provider_id: UUID | None = None, days: Iterable[date] = ()) -> None:
+        days = list(days)
+        self.invalidations["slots"] = time.time()
+        if provider_id is None or not days:
+            self.slots.clear()
+            return
+        lists = {(provider_id, None), (None, None)}
+        for day in days:
+            lists.add((provider_id, day))
+            lists.add((None, day))
+        for key in [key for key in self.slots if key[:2] in lists]:
+            del self.slots[key]
 
-    async def invalidate_slots(self) -> None:
-        self.slots.clear()
+    async def invalidated_at(self, family: str) -> float | None:
+        return self.invalidations.get(family)
 
 
 class DummyPublisher(EventPublisher):
@@ -10,7 +10,9 @@ from app.core.db import Base, create_engine, create_session_factory
 from app.domain.appointments.entities import AppointmentStatus
 from app.domain.users.entities import UserRole
 from app.infrastructure.db import models  # noqa: F401
+from app.infrastructure.mq.outbox_relay import relay_batch
 from app.infrastructure.repositories.appointments import SqlAlchemyAppointmentRepository
+from app.infrastructure.repositories.outbox import SqlAlchemyOutboxRepository
 from app.infrastructure.repositories.schedules import SqlAlchemyScheduleRepository
 from app.infrastructure.repositories.services import SqlAlchemyServiceRepository
 from app.infrastructure.repositories.users import SqlAlchemyUserRepository
@@ -46,6 +48,8 @@ async def test_booking_and_cancellation_flow():
             start_time = datetime.now(UTC) + timedelta(hours=1)
             end_time = start_time + timedelta(minutes=30)
             slot = await schedule_service.create_slot(provider.id, start_time, end_time)
+            with pytest.raises(ValueError, match="overlaps"):
+                await schedule_service.create_slot(provider.id, start_time + timedelta(minutes=15), end_time)
 
             appointment_repo = SqlAlchemyAppointmentRepository(session)
             appointment_service = AppointmentService(
@@ -63,6 +67,13 @@ async def test_booking_and_cancellation_flow():
                 slot_id=slot.id,
             )
             assert appointment.status == AppointmentStatus.created
+            with pytest.raises(ValueError, match="Slot is not available"):
+                await appointment_service.create_appointment(
+                    client_id=client.id,
+                    provider_id=provider.id,
+                    service_id=service.id,
+                    slot_id=slot.id,
+                )
             slots_after_booking = await schedule_service.list_available(provider.id, start_time.date())
             assert slots_after_booking == []
 
@@ -72,5 +83,62 @@ async def test_booking_and_cancellation_flow():
             assert len(slots_after_cancel) == 1
             assert slots_after_cancel[0].is_available is True
 
+            windows = [
+                (start_time + timedelta(days=day), end_time + timedelta(days=day)) for day in range(1, 4)
+            ]
+            created = await schedule_service.create_slots_bulk(provider.id, windows)
+            assert [(item.starts_at, item.ends_at) for item in created] == windows
+            with pytest.raises(ValueError, match="overlap"):
+                await schedule_service.create_slots_bulk(
+                    provider.id, [(end_time + timedelta(days=5), end_time + timedelta(days=5, minutes=30)), windows[0]]
+                )
+            await session.rollback()
+            assert len(await schedule_repo.list_available_on(provider.id, [windows[0][0].date()])) == 1
+
+            await appointment_service.create_appointment(client.id, provider.id, service.id, created[0].id)
+            await session.commit()
+            with pytest.raises(ValueError, match="not available"):
+                await appointment_service.create_appointments_batch(
+                    client.id, provider.id, service.id, [created[1].id, created[0].id]
+                )
+            assert len(await schedule_repo.list_available_on(provider.id, [windows[1][0].date()])) == 1
+            await session.rollback()
+            batch = await appointment_service.create_appointments_batch(
+                client.id, provider.id, service.id, [created[2].id, created[1].id]
+            )
+            assert [item.slot_id for item in batch] == [created[1].id, created[2].id]
+            assert publisher.events[-1]["headers"]["event"] == "appointment.batch_created"
+            days = [window[0].date() for window in windows]
+            assert await schedule_repo.list_available_on(provider.id, days) == []
+
+            cancelled_day = await appointment_service.cancel_appointments_bulk(
+                provider_id=provider.id, date_from=days[0], date_to=days[1]
+            )
+            assert [item.slot_id for item in cancelled_day] == [created[0].id, created[1].id]
+            assert all(item.status == AppointmentStatus.cancelled for item in cancelled_day)
+            assert len(await schedule_repo.list_available_on(provider.id, days)) == 2
+            assert publisher.events[-1]["headers"]["event"] == "appointment.batch_cancelled"
+            cancelled_ids = await appointment_service.cancel_appointments_bulk(appointment_ids=[batch[1].id])
+            assert [item.id for item in cancelled_ids] == [batch[1].id]
+            events = len(publisher.events)
+            assert await appointment_service.cancel_appointments_bulk(appointment_ids=[batch[1].id]) == []
+            assert len(publisher.events) == events
+
+            outbox_service = AppointmentService(
+                appointment_repo=appointment_repo,
+                schedule_repo=schedule_repo,
+                cache=cache,
+                publisher=publisher,
+                session=session,
+                outbox=SqlAlchemyOutboxRepository(session),
+            )
+            staged = await outbox_service.create_appointment(client.id, provider.id, service.id, created[0].id)
+            assert len(publisher.events) == events
+            await session.commit()
+            assert await relay_batch(session_factory, publisher, batch_size=10) == 1
+            assert publisher.events[-1]["headers"]["event"] == "appointment.created"
+            assert publisher.events[-1]["payload"]["appointment_id"] == str(staged.id)
+            assert await relay_batch(session_factory, publisher, batch_size=10) == 0
+
         await engine.dispose()
 
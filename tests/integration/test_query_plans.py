@@ -0,0 +1,128 @@
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from testcontainers.postgres import PostgresContainer
+
+from app.core.db import Base, create_engine
+from app.domain.schedules.entities import ScheduleSlot
+from app.domain.services.entities import Service
+from app.domain.users.entities import UserRole
+from app.infrastructure.db import models  # noqa: F401
+from app.infrastructure.db.models import AppointmentModel, ScheduleSlotModel, ServiceModel, UserModel
+from app.infrastructure.repositories.schedules import (
+    SqlAlchemyScheduleRepository,
+    available_slots_on_query,
+    available_slots_query,
+    overlapping_slots_query,
+)
+from app.infrastructure.repositories.services import SqlAlchemyServiceRepository
+
+
+def _literal_sql(stmt: Select) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.asyncio
+async def test_lookups_use_secondary_indexes():
+    with PostgresContainer("postgres:15") as pg:
+        db_url = pg.get_connection_url()
+        async_url = db_url.replace("postgresql+psycopg2://", "postgresql+asyncpg://").replace(
+            "postgresql://", "postgresql+asyncpg://"
+        )
+        engine = create_engine(async_url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        provider_ids = [uuid4() for _ in range(20)]
+        provider_id = provider_ids[0]
+        starts_at = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+        async with engine.begin() as conn:
+            await conn.execute(
+                UserModel.__table__.insert(),
+                [
+                    {"id": pid, "email": f"p{i}@example.com", "full_name": "Provider", "role": UserRole.provider}
+                    for i, pid in enumerate(provider_ids)
+                ],
+            )
+            await conn.execute(
+                ScheduleSlotModel.__table__.insert(),
+                [
+                    {
+                        "id": uuid4(),
+                        "provider_id": pid,
+                        "starts_at": starts_at + timedelta(hours=6 * i),
+                        "ends_at": starts_at + timedelta(hours=6 * i, minutes=30),
+                        "is_available": i % 2 == 0,
+                    }
+                    for pid in provider_ids
+                    for i in range(100)
+                ],
+            )
+            await conn.execute(
+                ServiceModel.__table__.insert(),
+                [
+                    {"id": uuid4(), "provider_id": pid, "title": f"Service {i}", "duration_min": 30, "price": 10}
+                    for pid in provider_ids
+                    for i in range(10)
+                ],
+            )
+            await conn.execute(text("ANALYZE"))
+
+        after = (starts_at + timedelta(hours=30), uuid4())
+        queries = {
+            "ix_schedule_slots_available_provider_starts_at_id": available_slots_query(provider_id, None, after, 50),
+            "ix_schedule_slots_available_starts_at_id": available_slots_query(None, None, after, 50),
+            "ix_schedule_slots_available_provider_date": available_slots_on_query(
+                provider_id, [date(2026, 3, 3), date(2026, 3, 4)]
+            ),
+            "ix_schedule_slots_available_date": available_slots_on_query(None, [date(2026, 3, 3)]),
+            "excl_schedule_slots_provider_period": overlapping_slots_query(
+                provider_id, starts_at + timedelta(days=3), starts_at + timedelta(days=4)
+            ),
+            "ix_services_provider_id_title_id": select(ServiceModel)
+            .where(ServiceModel.provider_id == provider_id)
+            .order_by(ServiceModel.title, ServiceModel.id),
+            "ix_appointments_client_id": select(AppointmentModel).where(AppointmentModel.client_id == uuid4()),
+            "ix_appointments_provider_id": select(AppointmentModel).where(AppointmentModel.provider_id == uuid4()),
+            "ix_appointments_slot_id": select(AppointmentModel).where(AppointmentModel.slot_id == uuid4()),
+        }
+        async with engine.connect() as conn:
+            # The tables are tiny; only check that the planner can use the index at all.
+            await conn.execute(text("SET enable_seqscan = off"))
+            for index_name, stmt in queries.items():
+                plan = (await conn.execute(text(f"EXPLAIN {_literal_sql(stmt)}"))).scalars().all()
+                assert any(index_name in line for line in plan), "\n".join(plan)
+            # A page of a multi-day listing walks the day index in order instead of sorting the whole range.
+            range_page = available_slots_query(None, date(2026, 3, 3), after, 50, until=date(2026, 3, 20))
+            plan = (await conn.execute(text(f"EXPLAIN {_literal_sql(range_page)}"))).scalars().all()
+            assert any("ix_schedule_slots_available_date" in line for line in plan), "\n".join(plan)
+            assert not any("Sort" in line for line in plan), "\n".join(plan)
+
+        async with AsyncSession(engine) as session:
+            repo = SqlAlchemyScheduleRepository(session)
+            expected = await repo.list_available(provider_id, None)
+            pages, cursor = [], None
+            while page := await repo.list_available(provider_id, None, cursor, 7):
+                pages.extend(page)
+                cursor = (page[-1].starts_at, page[-1].id)
+            assert pages == list(expected)
+            assert len(pages) == 50
+            # Entities are built from raw rows without validation, so the column types must already fit.
+            assert all(isinstance(slot, ScheduleSlot) and slot.starts_at.tzinfo is not None for slot in pages)
+
+            services = await SqlAlchemyServiceRepository(session).list(provider_id, None, 4)
+            assert [type(item.price) for item in services] == [float] * 4
+            assert all(isinstance(item, Service) and isinstance(item.id, UUID) for item in services)
+
+            expected = await repo.list_available_on(None, [date(2026, 3, 3) + timedelta(days=i) for i in range(4)])
+            pages, cursor = [], None
+            while page := await repo.list_available(None, date(2026, 3, 3), cursor, 9, until=date(2026, 3, 6)):
+                pages.extend(page)
+                cursor = (page[-1].starts_at, page[-1].id)
+            assert pages == list(expected)
+
+        await engine.dispose()
@@ -0,0 +1,61 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from testcontainers.postgres import PostgresContainer
+
+from app.core.db import Base, create_engine, create_session_factory
+from app.domain.appointments.entities import AppointmentStatus
+from app.domain.users.entities import UserRole
+from app.infrastructure.db import models  # noqa: F401
+from app.infrastructure.repositories.appointments import SqlAlchemyAppointmentRepository
+from app.infrastructure.repositories.schedules import SqlAlchemyScheduleRepository
+from app.infrastructure.repositories.services import SqlAlchemyServiceRepository
+from app.infrastructure.repositories.users import SqlAlchemyUserRepository
+
+
+@pytest.mark.asyncio
+async def test_create_methods_insert_and_return_in_one_statement():
+    with PostgresContainer("postgres:15") as pg:
+        db_url = pg.get_connection_url()
+        async_url = db_url.replace("postgresql+psycopg2://", "postgresql+asyncpg://").replace(
+            "postgresql://", "postgresql+asyncpg://"
+        )
+        engine = create_engine(async_url)
+        session_factory = create_session_factory(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        statements: list[str] = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async with session_factory() as session:
+            before = datetime.now(UTC)
+            statements.clear()
+            provider = await SqlAlchemyUserRepository(session).create("p@example.com", "Provider", UserRole.provider)
+            client = await SqlAlchemyUserRepository(session).create("c@example.com", "Client", UserRole.client)
+            service = await SqlAlchemyServiceRepository(session).create(provider.id, "Consultation", 30, 49.5)
+            slot = await SqlAlchemyScheduleRepository(session).create_slot(
+                provider.id, before + timedelta(hours=1), before + timedelta(hours=2)
+            )
+            assert slot is not None
+            appointment = await SqlAlchemyAppointmentRepository(session).create(
+                client.id, provider.id, service.id, slot.id
+            )
+            await session.commit()
+
+        assert len(statements) == 5
+        assert all(statement.startswith("INSERT") and "RETURNING" in statement for statement in statements)
+        # Ids and timestamps are generated in the repository and come back with the row.
+        assert provider.role == UserRole.provider and before <= provider.created_at <= datetime.now(UTC)
+        assert service.price == 49.5 and isinstance(service.price, float)
+        assert appointment.status == AppointmentStatus.created and appointment.created_at >= before
+
+        async with session_factory() as session:
+            assert await SqlAlchemyUserRepository(session).get(provider.id) == provider
+            assert await SqlAlchemyAppointmentRepository(session).get(appointment.id) == appointment
+
+        await engine.dispose()
@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
@@ -34,25 +34,26 @@ async def test_create_and_cancel_appointment():
     appointment_repo = Mock()
 
     slot_id = uuid4()
-    schedule_repo.lock_slot = AsyncMock(
-        return_value=ScheduleSlot(
-            id=slot_id,
-            provider_id=uuid4(),
-            starts_at=datetime.now(UTC),
-            ends_at=datetime.now(UTC),
-            is_available=True,
-        )
+    slot = ScheduleSlot(
+        id=slot_id,
+        provider_id=uuid4(),
+        starts_at=datetime.now(UTC),
+        ends_at=datetime.now(UTC),
+        is_available=False,
     )
-    schedule_repo.mark_slot_availability = AsyncMock()
-    appointment_repo.create = AsyncMock(
-        return_value=Appointment(
-            id=uuid4(),
-            client_id=uuid4(),
-            provider_id=uuid4(),
-            service_id=uuid4(),
-            slot_id=slot_id,
-            status=AppointmentStatus.created,
-            created_at=datetime.now(UTC),
+    schedule_repo.mark_slot_availability = AsyncMock(return_value=slot)
+    appointment_repo.book = AsyncMock(
+        return_value=(
+            Appointment(
+                id=uuid4(),
+                client_id=uuid4(),
+                provider_id=uuid4(),
+                service_id=uuid4(),
+                slot_id=slot_id,
+                status=AppointmentStatus.created,
+                created_at=datetime.now(UTC),
+            ),
+            slot,
         )
     )
     appointment_repo.get = AsyncMock(
@@ -95,3 +96,126 @@ async def test_create_and_cancel_appointment():
     assert publisher.events[-1]["headers"]["event"] == "appointment.cancelled"
     assert cache.slots == {}
 
+
+@pytest.mark.asyncio
+async def test_create_appointment_rejects_taken_slot():
+    appointment_repo = Mock()
+    appointment_repo.book = AsyncMock(return_value=None)
+    publisher = DummyPublisher()
+    service = AppointmentService(
+        appointment_repo=appointment_repo,
+        schedule_repo=Mock(),
+        cache=InMemoryCache(),
+        publisher=publisher,
+        session=StubSession(),
+    )
+
+    with pytest.raises(ValueError, match="Slot is not available"):
+        await service.create_appointment(uuid4(), uuid4(), uuid4(), uuid4())
+    assert publisher.events == []
+
+
+@pytest.mark.asyncio
+async def test_create_appointments_batch_publishes_once():
+    provider_id = uuid4()
+    starts_at = datetime(2026, 10, 18, 9, tzinfo=UTC)
+    booked = []
+    for offset in (0, 24):
+        slot = ScheduleSlot(
+            id=uuid4(),
+            provider_id=provider_id,
+            starts_at=starts_at + timedelta(hours=offset),
+            ends_at=starts_at + timedelta(hours=offset, minutes=30),
+            is_available=False,
+        )
+        appointment = Appointment(
+            id=uuid4(),
+            client_id=uuid4(),
+            provider_id=provider_id,
+            service_id=uuid4(),
+            slot_id=slot.id,
+            status=AppointmentStatus.created,
+            created_at=datetime.now(UTC),
+        )
+        booked.append((appointment, slot))
+    appointment_repo = Mock()
+    appointment_repo.book_many = AsyncMock(return_value=booked)
+    cache = InMemoryCache()
+    cache.invalidate_slots = AsyncMock()
+    publisher = DummyPublisher()
+    service = AppointmentService(
+        appointment_repo=appointment_repo,
+        schedule_repo=Mock(),
+        cache=cache,
+        publisher=publisher,
+        session=StubSession(),
+    )
+
+    slot_ids = [slot.id for _, slot in booked]
+    appointments = await service.create_appointments_batch(uuid4(), provider_id, uuid4(), slot_ids)
+
+    assert [item.slot_id for item in appointments] == slot_ids
+    cache.invalidate_slots.assert_awaited_once_with(provider_id, {slot.day for _, slot in booked})
+    assert len(publisher.events) == 1
+    assert publisher.events[0]["headers"]["event"] == "appointment.batch_created"
+    with pytest.raises(ValueError, match="Duplicate"):
+        await service.create_appointments_batch(uuid4(), provider_id, uuid4(), [slot_ids[0], slot_ids[0]])
+
+
+@pytest.mark.asyncio
+async def test_cancel_appointments_bulk_requires_scope():
+    appointment_repo = Mock()
+    appointment_repo.cancel_many = AsyncMock(return_value=[])
+    publisher = DummyPublisher()
+    service = AppointmentService(
+        appointment_repo=appointment_repo,
+        schedule_repo=Mock(),
+        cache=InMemoryCache(),
+        publisher=publisher,
+        session=StubSession(),
+    )
+
+    with pytest.raises(ValueError, match="date range"):
+        await service.cancel_appointments_bulk(provider_id=uuid4())
+    assert await service.cancel_appointments_bulk(appointment_ids=[uuid4()]) == []
+    assert publisher.events == []
+
+
+@pytest.mark.asyncio
+async def test_outbox_receives_events_instead_of_publisher():
+    slot = ScheduleSlot(
+        id=uuid4(),
+        provider_id=uuid4(),
+        starts_at=datetime.now(UTC),
+        ends_at=datetime.now(UTC),
+        is_available=False,
+    )
+    appointment = Appointment(
+        id=uuid4(),
+        client_id=uuid4(),
+        provider_id=slot.provider_id,
+        service_id=uuid4(),
+        slot_id=slot.id,
+        status=AppointmentStatus.created,
+        created_at=datetime.now(UTC),
+    )
+    appointment_repo = Mock()
+    appointment_repo.book = AsyncMock(return_value=(appointment, slot))
+    outbox = Mock()
+    outbox.add = AsyncMock()
+    publisher = DummyPublisher()
+    service = AppointmentService(
+        appointment_repo=appointment_repo,
+        schedule_repo=Mock(),
+        cache=InMemoryCache(),
+        publisher=publisher,
+        session=StubSession(),
+        outbox=outbox,
+    )
+
+    await service.create_appointment(appointment.client_id, slot.provider_id, appointment.service_id, slot.id)
+
+    assert publisher.events == []
+    outbox.add.assert_awaited_once()
+    assert outbox.add.await_args.kwargs["routing_key"] == "appointment.created"
+    assert outbox.add.await_args.kwargs["payload"]["appointment_id"] == str(appointment.id)
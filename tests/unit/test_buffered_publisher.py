@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.mq.buffered_publisher import BufferedEventPublisher
+from tests.fakes import DummyPublisher
+
+
+class GatedPublisher(DummyPublisher):
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def publish(self, routing_key: str, payload: dict, headers: dict | None = None) -> None:
+        await self.gate.wait()
+        await super().publish(routing_key, payload, headers)
+
+
+@pytest.mark.asyncio
+async def test_buffered_publisher_returns_before_broker_and_flushes_on_close():
+    inner = GatedPublisher()
+    publisher = BufferedEventPublisher(inner, queue_size=2, batch_size=10, enqueue_timeout=0.01)
+    publisher.start()
+
+    await publisher.publish("appointment.created", {"n": 1})
+    await asyncio.sleep(0)  # the drain task takes the first event and blocks on the broker
+    await publisher.publish("appointment.created", {"n": 2})
+    await publisher.publish("appointment.created", {"n": 3})
+    assert inner.events == []
+
+    # Queue full: the caller falls back to publishing inline once the broker responds.
+    inline = asyncio.create_task(publisher.publish("appointment.created", {"n": 4}))
+    await asyncio.sleep(0.05)
+    inner.gate.set()
+    await inline
+    await publisher.aclose()
+
+    assert sorted(event["payload"]["n"] for event in inner.events) == [1, 2, 3, 4]
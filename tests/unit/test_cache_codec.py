@@ -0,0 +1,56 @@
+import json
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.domain.schedules.entities import ScheduleSlot
+from app.domain.services.entities import Service
+from app.infrastructure.cache import codec
+
+
+def _slots(count: int) -> list[ScheduleSlot]:
+    provider_id = uuid4()
+    starts_at = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+    return [
+        ScheduleSlot(
+            id=uuid4(),
+            provider_id=provider_id,
+            starts_at=starts_at + timedelta(minutes=30 * i),
+            ends_at=starts_at + timedelta(minutes=30 * (i + 1)),
+            is_available=True,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("threshold", [0, 1_000_000])
+def test_slots_round_trip(threshold):
+    slots = _slots(50)
+    raw = codec.encode([codec.slot_to_row(slot) for slot in slots], 123.5, threshold)
+
+    decoded, soft_expires_at = codec.decode(raw, codec.slot_from_row)
+
+    assert decoded == slots
+    assert soft_expires_at == 123.5
+
+
+def test_large_payload_is_compressed():
+    rows = [codec.slot_to_row(slot) for slot in _slots(200)]
+
+    assert len(codec.encode(rows, 0, 1024)) < len(codec.encode(rows, 0, 1_000_000))
+
+
+def test_services_round_trip():
+    service = Service(id=uuid4(), provider_id=uuid4(), title="Consultation", duration_min=30, price=50.0)
+    raw = codec.encode([codec.service_to_row(service)], 0, 4096)
+
+    assert codec.decode(raw, codec.service_from_row)[0] == [service]
+
+
+def test_unknown_formats_read_as_miss():
+    legacy = json.dumps({"soft_expires_at": 0, "items": []}).encode()
+    future = codec.HEADER.pack(codec.FORMAT_VERSION + 1, 0, 0.0) + b"[]"
+
+    assert codec.decode(legacy, codec.slot_from_row) is None
+    assert codec.decode(future, codec.slot_from_row) is None
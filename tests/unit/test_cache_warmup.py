@@ -0,0 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, time, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.domain.schedules.entities import ScheduleSlot
+from app.infrastructure.cache import warmup
+from app.infrastructure.cache.warmup import warm_slots_cache
+
+
+class FakeScheduleRepository:
+    slots: list[ScheduleSlot] = []
+
+    def __init__(self, session):
+        self.session = session
+
+    async def list_available_between(self, starts_from, until):
+        return [slot for slot in self.slots if starts_from <= slot.starts_at < until]
+
+
+class RecordingCache:
+    def __init__(self):
+        self.batches = []
+        self.active = 0
+        self.max_active = 0
+
+    async def set_slots_many(self, entries):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        self.batches.append(list(entries))
+
+
+@asynccontextmanager
+async def session_factory():
+    yield object()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_writes_every_provider_day_in_bounded_batches(monkeypatch):
+    today = datetime.combine(datetime.now(UTC).date(), time(9, 0), tzinfo=UTC)
+    provider_ids = [uuid4() for _ in range(3)]
+    slots = [
+        ScheduleSlot(
+            id=uuid4(),
+            provider_id=provider_id,
+            starts_at=today + timedelta(days=offset),
+            ends_at=today + timedelta(days=offset, minutes=30),
+            is_available=True,
+        )
+        for provider_id in provider_ids
+        for offset in (0, 2)
+    ]
+    FakeScheduleRepository.slots = slots
+    monkeypatch.setattr(warmup, "SqlAlchemyScheduleRepository", FakeScheduleRepository)
+    cache = RecordingCache()
+
+    written = await warm_slots_cache(session_factory, cache, days=4, batch_size=5, concurrency=2)  # type: ignore[arg-type]
+
+    entries = [entry for batch in cache.batches for entry in batch]
+    days = [today.date() + timedelta(days=offset) for offset in range(4)]
+    assert written == len(entries) == 12
+    assert {(provider_id, day) for provider_id, day, _ in entries} == {(p, d) for p in provider_ids for d in days}
+    assert all(len(batch) <= 5 for batch in cache.batches)
+    assert len(cache.batches) == 3
+    assert cache.max_active <= 2
+    lists = {(provider_id, day): day_slots for provider_id, day, day_slots in entries}
+    for slot in slots:
+        assert lists[(slot.provider_id, slot.day)] == [slot]
+    # Days without slots are cached as empty so range reads do not fall through to the database.
+    assert lists[(provider_ids[0], days[1])] == []
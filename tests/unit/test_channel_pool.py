@@ -0,0 +1,59 @@
+import pytest
+from aio_pika import Message
+from aio_pika.exceptions import ChannelClosed
+
+from app.infrastructure.mq.channel_pool import ChannelPool
+
+
+class FakeExchange:
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def publish(self, message, routing_key):
+        if self.channel.fail:
+            self.channel.is_closed = True
+            raise ChannelClosed(406, "PRECONDITION_FAILED")
+        self.channel.published.append(routing_key)
+
+
+class FakeChannel:
+    def __init__(self):
+        self.is_closed = False
+        self.fail = False
+        self.published: list[str] = []
+        self.default_exchange = FakeExchange(self)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.opened: list[FakeChannel] = []
+
+    async def channel(self, publisher_confirms=True):
+        assert publisher_confirms
+        channel = FakeChannel()
+        self.opened.append(channel)
+        return channel
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_reuses_channels_and_replaces_failed_ones():
+    connection = FakeConnection()
+    pool = ChannelPool(connection, size=2)
+
+    for _ in range(4):
+        await pool.publish(Message(b"{}"), routing_key="notifications.send")
+    assert len(connection.opened) == 2
+    assert [len(channel.published) for channel in connection.opened] == [2, 2]
+
+    connection.opened[0].fail = True
+    await pool.publish(Message(b"{}"), routing_key="notifications.send")
+    assert len(connection.opened[1].published) == 3
+    await pool.publish(Message(b"{}"), routing_key="notifications.send")
+    assert len(connection.opened) == 3
+    assert connection.opened[2].published == ["notifications.send"]
+
+    await pool.close()
+    assert all(channel.is_closed for channel in connection.opened)
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+from app.core.config import DatabaseSettings
+from app.core.db import TimedQueuePool, create_engine, instrument_pool
+from app.core.metrics import MetricsRegistry
+
+
+def test_pool_gauges_follow_checkouts():
+    settings = DatabaseSettings.model_validate(
+        {"url": "postgresql+asyncpg://app@primary/app", "pool_size": 2, "max_overflow": 1}
+    )
+    engine = create_engine(settings.url, settings, name="primary")
+    metrics = MetricsRegistry()
+    instrument_pool(engine, "primary", metrics=metrics)
+    # Stand-in for the pool dispose() would create, handing out fake DBAPI connections.
+    pool = TimedQueuePool(MagicMock, pool_size=2, max_overflow=1, logging_name="primary")
+    engine.sync_engine.pool = pool
+
+    connections = [pool.connect() for _ in range(3)]
+    rendered = metrics.render()
+    assert 'db_pool_size{pool="primary"} 2.0' in rendered
+    assert 'db_pool_checked_out{pool="primary"} 3.0' in rendered
+    assert 'db_pool_overflow{pool="primary"} 1.0' in rendered
+
+    for connection in connections:
+        connection.close()
+    rendered = metrics.render()
+    assert 'db_pool_checked_out{pool="primary"} 0.0' in rendered
+    assert 'db_pool_overflow{pool="primary"} 0.0' in rendered
@@ -0,0 +1,30 @@
+from uuid import uuid4
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+from app.infrastructure.cache.instrumented import CacheMetrics, InstrumentedCache
+from tests.fakes import InMemoryCache
+
+
+@pytest.mark.asyncio
+async def test_records_hits_misses_and_invalidations():
+    metrics_registry = MetricsRegistry()
+    metrics = CacheMetrics(metrics_registry)
+    cache = InstrumentedCache(InMemoryCache(), metrics)
+    provider_id = uuid4()
+
+    assert await cache.get_services(provider_id) is None
+    await cache.set_services(provider_id, [])
+    assert (await cache.get_services(provider_id)).value == []
+    await cache.invalidate_slots()
+
+    assert metrics.requests.value(family="services", result="miss") == 1
+    assert metrics.requests.value(family="services", result="hit") == 1
+    assert metrics.get_seconds.count(family="services") == 2
+    assert metrics.set_seconds.count(family="services") == 1
+    assert metrics.invalidations.value(family="slots", scope="all") == 1
+
+    exposition = metrics_registry.render()
+    assert 'cache_requests_total{family="services",result="hit"} 1.0' in exposition
+    assert 'cache_get_seconds_count{family="services"} 2' in exposition
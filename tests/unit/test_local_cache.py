@@ -0,0 +1,88 @@
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import RedisSettings
+from app.domain.schedules.entities import ScheduleSlot
+from app.infrastructure.cache.local_cache import LocalCache
+from tests.fakes import InMemoryCache
+
+
+def _settings(**overrides) -> RedisSettings:
+    return RedisSettings(url="redis://localhost:6379/0", **overrides)
+
+
+def _slot(provider_id) -> ScheduleSlot:
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    return ScheduleSlot(
+        id=uuid4(),
+        provider_id=provider_id,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(minutes=30),
+        is_available=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_hit_skips_inner_cache():
+    inner = InMemoryCache()
+    cache = LocalCache(inner, Mock(publish=AsyncMock()), _settings())
+    provider_id = uuid4()
+    slots = [_slot(provider_id)]
+
+    await cache.set_slots(provider_id, None, slots)
+    inner.slots.clear()
+
+    assert list((await cache.get_slots(provider_id, None)).value) == slots
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_broadcast_and_applied_by_other_replicas():
+    client = Mock(publish=AsyncMock())
+    inner = InMemoryCache()
+    publisher = LocalCache(inner, client, _settings())
+    subscriber = LocalCache(inner, client, _settings())
+    provider_id = uuid4()
+    slot = _slot(provider_id)
+
+    await subscriber.set_slots(provider_id, slot.day, [slot])
+    await publisher.invalidate_slots(provider_id, [slot.day])
+
+    _, raw = client.publish.await_args.args
+    assert json.loads(raw)["provider_id"] == str(provider_id)
+    subscriber.handle_message(raw)
+    assert await subscriber.get_slots(provider_id, slot.day) is None
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    cache = LocalCache(InMemoryCache(), Mock(publish=AsyncMock()), _settings(local_cache_max_entries=2))
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    await cache.set_services(first, [])
+    await cache.set_services(second, [])
+    await cache.get_services(first)
+    await cache.set_services(third, [])
+
+    assert cache._get(("services", first, None, None)) is not None
+    assert cache._get(("services", second, None, None)) is None
+
+
+@pytest.mark.asyncio
+async def test_scoped_invalidation_drops_every_page_of_affected_lists():
+    cache = LocalCache(InMemoryCache(), Mock(publish=AsyncMock()), _settings())
+    provider_id, other_provider_id = uuid4(), uuid4()
+    slot = _slot(provider_id)
+    after = (slot.starts_at, slot.id)
+
+    await cache.set_slots(provider_id, slot.day, [slot], None, 1)
+    await cache.set_slots(provider_id, slot.day, [], after, 1)
+    await cache.set_slots(other_provider_id, slot.day, [], None, 1)
+    await cache.invalidate_slots(provider_id, [slot.day])
+
+    assert cache._get(("slots", provider_id, slot.day, None, 1)) is None
+    assert cache._get(("slots", provider_id, slot.day, after, 1)) is None
+    assert cache._get(("slots", other_provider_id, slot.day, None, 1)) is not None
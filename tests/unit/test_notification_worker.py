@@ -0,0 +1,149 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+import worker.main
+from app.core.config import get_settings
+from worker.main import NotificationWorker
+
+
+class FakeMessage:
+    def __init__(self, appointment_id: str, acked: list[str]):
+        self.appointment_id = appointment_id
+        self.headers = {"event": "appointment.created"}
+        self.body = json.dumps({"appointment_id": appointment_id}).encode()
+        self._acked = acked
+
+    @asynccontextmanager
+    async def process(self):
+        yield
+        self._acked.append(self.appointment_id)
+
+
+class FakeQueueIterator:
+    """Hands out the queued messages, then blocks like a live consumer until closed."""
+
+    def __init__(self, messages: list[FakeMessage]):
+        self._messages = list(messages)
+        self._closed = asyncio.Event()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> FakeMessage:
+        if self._messages:
+            return self._messages.pop(0)
+        await self._closed.wait()
+        raise StopAsyncIteration
+
+    async def close(self) -> None:
+        self._closed.set()
+
+
+class FakeChannel:
+    def __init__(self, queue_iter: FakeQueueIterator):
+        self.queue_iter = queue_iter
+        self.prefetch_count: int | None = None
+
+    async def set_qos(self, prefetch_count: int) -> None:
+        self.prefetch_count = prefetch_count
+
+    async def declare_queue(self, name: str, durable: bool):
+        return self
+
+    def iterator(self) -> FakeQueueIterator:
+        return self.queue_iter
+
+    async def close(self) -> None:
+        return None
+
+
+class FakeConnection:
+    def __init__(self, channel: FakeChannel):
+        self._channel = channel
+
+    async def channel(self) -> FakeChannel:
+        return self._channel
+
+    async def close(self) -> None:
+        return None
+
+
+class GatedNotifier:
+    def __init__(self):
+        self.permits = asyncio.Semaphore(0)
+        self.active = 0
+        self.max_active = 0
+        self.closed = False
+
+    async def start(self) -> None:
+        return None
+
+    async def send_message(self, text: str) -> bool:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.permits.acquire()
+        finally:
+            self.active -= 1
+        return True
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_worker_bounds_concurrency_acks_each_message_and_drains_on_close(monkeypatch):
+    settings = get_settings()
+    settings = settings.model_copy(
+        update={"rabbit": settings.rabbit.model_copy(update={"prefetch_count": 5, "worker_concurrency": 2})}
+    )
+    acked: list[str] = []
+    channel = FakeChannel(FakeQueueIterator([FakeMessage(str(n), acked) for n in range(3)]))
+
+    async def connect_robust(url: str) -> FakeConnection:
+        return FakeConnection(channel)
+
+    monkeypatch.setattr(worker.main, "connect_robust", connect_robust)
+    notification_worker = NotificationWorker(settings)
+    notifier = GatedNotifier()
+    notification_worker.notifier = notifier  # type: ignore[assignment]
+
+    started = asyncio.create_task(notification_worker.start())
+    await _settle()
+    assert channel.prefetch_count == 5
+    assert notifier.active == 2
+    assert acked == []
+
+    # Finishing one handler acks just that message and lets the third one in.
+    notifier.permits.release()
+    await _settle()
+    assert acked == ["0"]
+    assert notifier.active == 2
+    assert notifier.max_active == 2
+
+    closing = asyncio.create_task(notification_worker.close())
+    await _settle()
+    assert not closing.done()
+    assert not notifier.closed
+
+    notifier.permits.release()
+    notifier.permits.release()
+    await closing
+    await started
+
+    assert sorted(acked) == ["0", "1", "2"]
+    assert notifier.closed
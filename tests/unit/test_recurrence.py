@@ -0,0 +1,86 @@
+from datetime import UTC, date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.application.schedules.recurrence import expand_recurrence
+
+
+def test_expands_weekdays_working_hours_and_skips_exceptions():
+    windows = expand_recurrence(
+        date(2026, 3, 2),  # Monday
+        date(2026, 3, 8),
+        weekdays={0, 2},
+        day_start=time(9, 0),
+        day_end=time(10, 45),
+        slot_minutes=30,
+        exceptions={date(2026, 3, 4)},
+    )
+
+    assert windows == [
+        (datetime(2026, 3, 2, 9, 0, tzinfo=UTC), datetime(2026, 3, 2, 9, 30, tzinfo=UTC)),
+        (datetime(2026, 3, 2, 9, 30, tzinfo=UTC), datetime(2026, 3, 2, 10, 0, tzinfo=UTC)),
+        (datetime(2026, 3, 2, 10, 0, tzinfo=UTC), datetime(2026, 3, 2, 10, 30, tzinfo=UTC)),
+    ]
+
+
+def test_working_hours_are_local_to_the_template_timezone():
+    windows = expand_recurrence(
+        date(2026, 3, 27),
+        date(2026, 3, 30),
+        weekdays={4, 0},
+        day_start=time(9, 0),
+        day_end=time(10, 0),
+        slot_minutes=60,
+        tz=ZoneInfo("Europe/Berlin"),
+    )
+
+    # Central European Summer Time starts on 2026-03-29.
+    assert [starts_at for starts_at, _ in windows] == [
+        datetime(2026, 3, 27, 8, 0, tzinfo=UTC),
+        datetime(2026, 3, 30, 7, 0, tzinfo=UTC),
+    ]
+
+
+def test_spring_forward_day_loses_the_skipped_hour():
+    windows = expand_recurrence(
+        date(2026, 3, 29),
+        date(2026, 3, 29),
+        weekdays={6},
+        day_start=time(1, 0),
+        day_end=time(4, 0),
+        slot_minutes=60,
+        tz=ZoneInfo("Europe/Berlin"),
+    )
+
+    # 01:00 CET to 04:00 CEST is two hours long.
+    assert windows == [
+        (datetime(2026, 3, 29, 0, 0, tzinfo=UTC), datetime(2026, 3, 29, 1, 0, tzinfo=UTC)),
+        (datetime(2026, 3, 29, 1, 0, tzinfo=UTC), datetime(2026, 3, 29, 2, 0, tzinfo=UTC)),
+    ]
+
+
+def test_fall_back_day_keeps_the_repeated_hour():
+    windows = expand_recurrence(
+        date(2026, 10, 25),
+        date(2026, 10, 25),
+        weekdays={6},
+        day_start=time(1, 0),
+        day_end=time(4, 0),
+        slot_minutes=60,
+        tz=ZoneInfo("Europe/Berlin"),
+    )
+
+    # 01:00 CEST to 04:00 CET is four hours long; 02:00-03:00 local happens twice.
+    assert [starts_at for starts_at, _ in windows] == [
+        datetime(2026, 10, 24, 23, 0, tzinfo=UTC),
+        datetime(2026, 10, 25, 0, 0, tzinfo=UTC),
+        datetime(2026, 10, 25, 1, 0, tzinfo=UTC),
+        datetime(2026, 10, 25, 2, 0, tzinfo=UTC),
+    ]
+    assert all(ends_at - starts_at == timedelta(hours=1) for starts_at, ends_at in windows)
+
+
+def test_rejects_templates_that_expand_too_far():
+    with pytest.raises(ValueError):
+        expand_recurrence(date(2026, 1, 1), date(2026, 12, 31), set(range(7)), time(0, 0), time(23, 59), 1)
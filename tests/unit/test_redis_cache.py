@@ -0,0 +1,122 @@
+import time
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import RedisSettings
+from app.domain.schedules.entities import ScheduleSlot
+from app.domain.services.entities import Service
+from app.infrastructure.cache.redis_cache import RedisCache
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self.client.round_trips += 1
+        return [getattr(self.client, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """Synchronous dict-backed subset of Redis, reachable only through pipelines."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def set(self, key, value):
+        self.data[key] = str(value).encode()
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+
+def _slot(provider_id) -> ScheduleSlot:
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    return ScheduleSlot(
+        id=uuid4(), provider_id=provider_id, starts_at=starts_at, ends_at=starts_at + timedelta(minutes=30), is_available=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidation_makes_cached_lists_unreachable():
+    client = FakeRedis()
+    cache = RedisCache(client, RedisSettings(url="redis://localhost:6379/0"))
+    # A second process still holding the old generation must not read stale lists either.
+    other = RedisCache(client, RedisSettings(url="redis://localhost:6379/0"))
+    provider_id = uuid4()
+    slot = _slot(provider_id)
+    service = Service(id=uuid4(), provider_id=provider_id, title="Consultation", duration_min=30, price=50.0)
+
+    await cache.set_slots(provider_id, slot.day, [slot], after=None, limit=50)
+    await cache.set_services(None, [service])
+    client.round_trips = 0
+    assert (await cache.get_slots(provider_id, slot.day, after=None, limit=50)).value == [slot]
+    assert (await other.get_services(None)).value == [service]
+    assert client.round_trips == 2
+
+    await cache.invalidate_slots(provider_id, [slot.day])
+    assert await cache.get_slots(provider_id, slot.day, after=None, limit=50) is None
+
+    await cache.set_slots(provider_id, None, [slot])
+    assert (await other.get_slots(provider_id, None)).value == [slot]
+    await cache.invalidate_slots()
+    assert await other.get_slots(provider_id, None) is None
+
+    await cache.invalidate_services()
+    assert await other.get_services(None) is None
+    await other.set_services(None, [service])
+    assert (await cache.get_services(None)).value == [service]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_records_when_each_family_was_invalidated():
+    client = FakeRedis()
+    cache = RedisCache(client, RedisSettings(url="redis://localhost:6379/0"))
+    provider_id = uuid4()
+    assert await cache.invalidated_at("slots") is None
+
+    before = time.time()
+    await cache.invalidate_slots(provider_id, [date(2026, 3, 2)])
+    scoped = await cache.invalidated_at("slots")
+    assert scoped is not None and scoped >= before
+    assert await cache.invalidated_at("services") is None
+
+    await cache.invalidate_services()
+    assert (await cache.invalidated_at("services")) >= scoped
@@ -0,0 +1,87 @@
+import math
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.core.db import ReplicaRouter, create_engine, create_session_factory
+
+
+@pytest.mark.asyncio
+async def test_replica_router_round_robins_fresh_replicas_and_falls_back_to_primary():
+    primary = create_session_factory(create_engine("postgresql+asyncpg://app@primary/app"))
+    replicas = [create_engine(f"postgresql+asyncpg://app@replica{index}/app") for index in range(3)]
+    lags: dict[str, float | Exception] = {"replica0": 0.5, "replica1": 30.0, "replica2": 0.0}
+
+    async def measure_lag(engine):
+        lag = lags[engine.url.host]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+    router = ReplicaRouter(primary, replicas, max_lag_seconds=5.0)
+    router._measure_lag = measure_lag  # type: ignore[method-assign]
+    assert router.session_factory() is primary
+
+    await router.check()
+    picked = {router.session_factory().kw["bind"].url.host for _ in range(4)}
+    assert picked == {"replica0", "replica2"}
+
+    lags.update(replica0=ConnectionError("down"), replica2=10.0)
+    await router.check()
+    assert router.session_factory() is primary
+    await router.aclose()
+
+
+@pytest.mark.asyncio
+async def test_replica_without_streaming_wal_receiver_counts_as_lagging():
+    primary = create_session_factory(create_engine("postgresql+asyncpg://app@primary/app"))
+    replica = Mock()
+    conn = Mock()
+    # REPLICA_LAG_SQL yields NULL when the WAL receiver is not streaming.
+    conn.execute = AsyncMock(return_value=Mock(scalar_one=Mock(return_value=None)))
+
+    @asynccontextmanager
+    async def connect():
+        yield conn
+
+    replica.connect = connect
+    router = ReplicaRouter(primary, [replica], max_lag_seconds=5.0)
+
+    assert await router._measure_lag(replica) == math.inf
+    await router.check()
+    assert router.session_factory() is primary
+
+
+@pytest.mark.asyncio
+async def test_cache_fills_use_a_replica_only_once_it_replayed_past_the_invalidation():
+    replayed_at = datetime(2026, 3, 2, 10, 0, 0, tzinfo=UTC)
+
+    def factory(name, replayed=None):
+        session = Mock(name=name)
+        session.execute = AsyncMock(return_value=Mock(scalar_one=Mock(return_value=replayed)))
+
+        @asynccontextmanager
+        async def open_session():
+            yield session
+
+        return Mock(side_effect=open_session), session
+
+    primary, primary_session = factory("primary")
+    replica, replica_session = factory("replica", replayed_at)
+    router = ReplicaRouter(primary, [], clock_skew_seconds=1.0)
+    router._factories, router._healthy = [replica], [True]
+
+    async def pick(not_before):
+        async with router.session_replayed_since(not_before) as session:
+            return session
+
+    assert await pick(None) is replica_session
+    assert await pick(replayed_at.timestamp() - 5) is replica_session
+    # Within the clock skew the replica may still be missing the invalidating write.
+    assert await pick(replayed_at.timestamp() - 0.5) is primary_session
+    assert await pick(replayed_at.timestamp() + 5) is primary_session
+
+    replica_session.execute.side_effect = ConnectionError("down")
+    assert await pick(replayed_at.timestamp() - 5) is primary_session
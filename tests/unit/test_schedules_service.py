@@ -0,0 +1,286 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, call
+from uuid import uuid4
+
+import pytest
+
+from app.application.interfaces.cache import CacheEntry
+from app.application.schedules.service import ScheduleService
+from app.application.single_flight import SingleFlight
+from app.domain.schedules.entities import ScheduleSlot
+from tests.fakes import InMemoryCache
+
+
+class StubSession:
+    async def commit(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_create_slot_invalidates_only_affected_provider_day():
+    cache = InMemoryCache()
+    provider_id = uuid4()
+    other_provider_id = uuid4()
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    slot = ScheduleSlot(
+        id=uuid4(),
+        provider_id=provider_id,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(minutes=30),
+        is_available=True,
+    )
+    repo = Mock()
+    repo.create_slot = AsyncMock(return_value=slot)
+
+    await cache.set_slots(provider_id, starts_at.date(), [])
+    await cache.set_slots(provider_id, None, [])
+    await cache.set_slots(None, starts_at.date(), [])
+    await cache.set_slots(other_provider_id, starts_at.date(), [])
+    await cache.set_slots(provider_id, starts_at.date() + timedelta(days=1), [])
+
+    service = ScheduleService(repo=repo, cache=cache, session=StubSession())
+    await service.create_slot(provider_id, slot.starts_at, slot.ends_at)
+
+    assert await cache.get_slots(provider_id, starts_at.date()) is None
+    assert await cache.get_slots(provider_id, None) is None
+    assert await cache.get_slots(None, starts_at.date()) is None
+    assert (await cache.get_slots(other_provider_id, starts_at.date())).value == []
+    assert (await cache.get_slots(provider_id, starts_at.date() + timedelta(days=1))).value == []
+
+
+@pytest.mark.asyncio
+async def test_stale_slots_are_served_and_refreshed_in_background():
+    cache = InMemoryCache()
+    provider_id = uuid4()
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    stale_slot = ScheduleSlot(
+        id=uuid4(),
+        provider_id=provider_id,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(minutes=30),
+        is_available=True,
+    )
+    cache.get_slot_days = AsyncMock(return_value={stale_slot.day: CacheEntry([stale_slot], stale=True)})
+    cache.set_slot_days = AsyncMock()
+    request_repo = Mock()
+    request_repo.list_available_on = AsyncMock()
+    refresh_repo = Mock()
+    refresh_repo.list_available_on = AsyncMock(return_value=[])
+
+    @asynccontextmanager
+    async def refresh_scope():
+        yield refresh_repo
+
+    single_flight = SingleFlight()
+    service = ScheduleService(
+        repo=request_repo,
+        cache=cache,
+        session=StubSession(),
+        single_flight=single_flight,
+        refresh_scope=refresh_scope,
+    )
+
+    assert await service.list_available(provider_id, starts_at.date()) == [stale_slot]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    request_repo.list_available_on.assert_not_awaited()
+    refresh_repo.list_available_on.assert_awaited_once_with(provider_id, [starts_at.date()])
+    cache.set_slot_days.assert_awaited_once_with(provider_id, {starts_at.date(): []})
+
+
+@pytest.mark.asyncio
+async def test_date_range_loads_only_days_missing_from_cache():
+    cache = InMemoryCache()
+    provider_id = uuid4()
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    slots = [
+        ScheduleSlot(
+            id=uuid4(),
+            provider_id=provider_id,
+            starts_at=starts_at + timedelta(days=offset),
+            ends_at=starts_at + timedelta(days=offset, minutes=30),
+            is_available=True,
+        )
+        for offset in range(3)
+    ]
+    await cache.set_slot_days(provider_id, {slots[0].day: [slots[0]], slots[2].day: [slots[2]]})
+    repo = Mock()
+    repo.list_available_on = AsyncMock(return_value=[slots[1]])
+    service = ScheduleService(repo=repo, cache=cache, session=StubSession())
+
+    page = await service.list_available_range(provider_id, slots[0].day, slots[2].day, limit=2)
+    rest = await service.list_available_range(
+        provider_id, slots[0].day, slots[2].day, after=(page[-1].starts_at, page[-1].id), limit=2
+    )
+
+    assert page + rest == slots
+    repo.list_available_on.assert_awaited_once_with(provider_id, [slots[1].day])
+    assert (await cache.get_slots(provider_id, slots[1].day)).value == [slots[1]]
+
+
+@pytest.mark.asyncio
+async def test_all_provider_ranges_are_paged_in_the_database():
+    cache = InMemoryCache()
+    cache.get_slot_days = AsyncMock()
+    day = datetime(2026, 3, 2, tzinfo=UTC).date()
+    repo = Mock()
+    repo.list_available = AsyncMock(return_value=[])
+    repo.list_available_on = AsyncMock()
+    service = ScheduleService(repo=repo, cache=cache, session=StubSession())
+    after = (datetime(2026, 3, 2, 10, 0, tzinfo=UTC), uuid4())
+
+    await service.list_available_range(None, day, day + timedelta(days=6), after=after, limit=50)
+    await service.list_available_range(None, day, day, after=after, limit=50)
+
+    assert repo.list_available.await_args_list == [
+        call(None, day, after, 50, until=day + timedelta(days=6)),
+        call(None, day, after, 50),
+    ]
+    repo.list_available_on.assert_not_awaited()
+    cache.get_slot_days.assert_not_awaited()
+    # Only the single-day page has a key that invalidating the day can reach.
+    assert (await cache.get_slots(None, day, after, 50)).value == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_invalidates_affected_days_once():
+    provider_id = uuid4()
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    slots = [
+        ScheduleSlot(
+            id=uuid4(),
+            provider_id=provider_id,
+            starts_at=starts_at + timedelta(days=offset),
+            ends_at=starts_at + timedelta(days=offset, minutes=30),
+            is_available=True,
+        )
+        for offset in range(3)
+    ]
+    repo = Mock()
+    repo.create_slots = AsyncMock(return_value=slots)
+    cache = InMemoryCache()
+    cache.invalidate_slots = AsyncMock()
+    service = ScheduleService(repo=repo, cache=cache, session=StubSession())
+
+    created = await service.create_slots_bulk(provider_id, [(slot.starts_at, slot.ends_at) for slot in slots])
+
+    assert created == slots
+    cache.invalidate_slots.assert_awaited_once_with(provider_id, {slot.day for slot in slots})
+
+    repo.create_slots = AsyncMock(return_value=None)
+    with pytest.raises(ValueError):
+        await service.create_slots_bulk(provider_id, [(starts_at, starts_at + timedelta(minutes=30))])
+
+
+@pytest.mark.asyncio
+async def test_overlapping_slot_is_rejected_without_invalidation():
+    repo = Mock()
+    repo.create_slot = AsyncMock(return_value=None)
+    cache = InMemoryCache()
+    cache.invalidate_slots = AsyncMock()
+    service = ScheduleService(repo=repo, cache=cache, session=StubSession())
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+
+    with pytest.raises(ValueError, match="overlaps"):
+        await service.create_slot(uuid4(), starts_at, starts_at + timedelta(minutes=30))
+
+    cache.invalidate_slots.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_shared_miss_load_runs_on_its_own_session_and_survives_cancelled_leader():
+    cache = InMemoryCache()
+    provider_id = uuid4()
+    day = datetime(2026, 3, 2, tzinfo=UTC).date()
+    release = asyncio.Event()
+    request_repo = Mock()
+    request_repo.list_available_on = AsyncMock()
+    refresh_repo = Mock()
+
+    async def list_available_on(provider_id, days):
+        await release.wait()
+        return []
+
+    refresh_repo.list_available_on = list_available_on
+    scopes_closed = []
+
+    @asynccontextmanager
+    async def refresh_scope():
+        yield refresh_repo
+        scopes_closed.append(True)
+
+    service = ScheduleService(
+        repo=request_repo,
+        cache=cache,
+        session=StubSession(),
+        single_flight=SingleFlight(),
+        refresh_scope=refresh_scope,
+    )
+
+    leader = asyncio.create_task(service.list_available(provider_id, day))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(service.list_available(provider_id, day))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == []
+    request_repo.list_available_on.assert_not_awaited()
+    assert scopes_closed == [True]
+    assert (await cache.get_slots(provider_id, day)).value == []
+
+
+@pytest.mark.asyncio
+async def test_day_miss_after_invalidation_does_not_join_a_running_refresh():
+    provider_id = uuid4()
+    starts_at = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    old_slot, fresh_slot = (
+        ScheduleSlot(
+            id=uuid4(),
+            provider_id=provider_id,
+            starts_at=starts_at + timedelta(hours=offset),
+            ends_at=starts_at + timedelta(hours=offset, minutes=30),
+            is_available=True,
+        )
+        for offset in range(2)
+    )
+
+    class StaleCache(InMemoryCache):
+        async def get_slot_days(self, provider_id, days):
+            entries = await super().get_slot_days(provider_id, days)
+            return {day: CacheEntry(entry.value, stale=True) for day, entry in entries.items()}
+
+    cache = StaleCache()
+    await cache.set_slot_days(provider_id, {old_slot.day: [old_slot]})
+    release = asyncio.Event()
+    loads = 0
+
+    async def list_available_on(provider_id, days):
+        nonlocal loads
+        loads += 1
+        if loads == 1:
+            await release.wait()
+        return [fresh_slot]
+
+    refresh_repo = Mock()
+    refresh_repo.list_available_on = list_available_on
+
+    @asynccontextmanager
+    async def refresh_scope():
+        yield refresh_repo
+
+    service = ScheduleService(
+        repo=Mock(), cache=cache, session=StubSession(), single_flight=SingleFlight(), refresh_scope=refresh_scope
+    )
+
+    assert await service.list_available(provider_id, old_slot.day) == [old_slot]
+    await asyncio.sleep(0)
+    await cache.invalidate_slots(provider_id, [old_slot.day])
+
+    assert await asyncio.wait_for(service.list_available(provider_id, old_slot.day), timeout=1) == [fresh_slot]
+    assert loads == 2
+    release.set()
+    await asyncio.sleep(0)
@@ -0,0 +1,59 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from app.application.interfaces.cache import CacheEntry
+from app.application.services.service import ServicesService
+from app.application.single_flight import SingleFlight
+from app.domain.services.entities import Service
+from tests.fakes import InMemoryCache
+
+
+class StaleCache(InMemoryCache):
+    async def get_services(self, provider_id, after=None, limit=None):
+        entry = await super().get_services(provider_id, after, limit)
+        return CacheEntry(entry.value, stale=True) if entry is not None else None
+
+
+def _service(title: str) -> Service:
+    return Service(id=uuid4(), provider_id=uuid4(), title=title, duration_min=30, price=10.0)
+
+
+@pytest.mark.asyncio
+async def test_miss_after_invalidation_does_not_join_a_running_refresh():
+    cache = StaleCache()
+    old, fresh = [_service("old")], [_service("fresh")]
+    await cache.set_services(None, old)
+    release = asyncio.Event()
+    refreshes = 0
+
+    async def list_services(provider_id, after, limit):
+        nonlocal refreshes
+        refreshes += 1
+        if refreshes == 1:
+            await release.wait()
+        return fresh
+
+    repo = Mock()
+    repo.list = list_services
+
+    @asynccontextmanager
+    async def refresh_scope():
+        yield repo
+
+    service = ServicesService(
+        repo=Mock(), cache=cache, session=Mock(), single_flight=SingleFlight(), refresh_scope=refresh_scope
+    )
+
+    assert await service.list_services() == old
+    await asyncio.sleep(0)
+    await cache.invalidate_services()
+
+    # Joining the refresh would wait on it, and hand back whatever the refresh returns.
+    assert await asyncio.wait_for(service.list_services(), timeout=1) == fresh
+    assert refreshes == 2
+    release.set()
+    await asyncio.sleep(0)
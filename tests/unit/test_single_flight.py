@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from app.application.single_flight import SingleFlight
+
+
+class HeldLock:
+    async def acquire(self, key: str, ttl_ms: int) -> str | None:
+        return None
+
+    async def release(self, key: str, token: str) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [1, 2, 3]
+
+    results = await asyncio.gather(*(single_flight.do("slots:key", load) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result == [1, 2, 3] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_follower_loads_itself_when_leader_fails():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def failing_load() -> int:
+        started.set()
+        await asyncio.sleep(0.01)
+        raise RuntimeError("session closed")
+
+    async def load() -> int:
+        return 42
+
+    leader = asyncio.create_task(single_flight.do("key", failing_load))
+    await started.wait()
+    follower = await single_flight.do("key", load)
+
+    assert follower == 42
+    with pytest.raises(RuntimeError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_waits_for_other_replica_to_fill_cache():
+    single_flight = SingleFlight(HeldLock(), lock_ttl_ms=1000, poll_interval=0.001)
+    cache: dict[str, int] = {}
+
+    async def load() -> int:
+        raise AssertionError("should not hit the database")
+
+    async def recheck() -> int | None:
+        cache.setdefault("key", 7)
+        return cache.get("key")
+
+    assert await single_flight.do("key", load, recheck=recheck) == 7
@@ -0,0 +1,66 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core.config import TelegramSettings
+from app.infrastructure.notifications.telegram import TelegramNotifier
+
+
+class StubBotApi(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    requests: list[tuple[str, dict, int]] = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubBotApi.requests.append((self.path, body, self.client_address[1]))
+        status = 500 if body["text"] == "fail" else 200
+        reply = json.dumps({"ok": status == 200}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def bot_api():
+    StubBotApi.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBotApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_telegram_notifier_reuses_one_connection(bot_api):
+    notifier = TelegramNotifier(TelegramSettings(bot_token="token", chat_id="-100", api_base_url=bot_api))
+    await notifier.start()
+    try:
+        assert await notifier.send_message("first") is True
+        assert await notifier.send_message("second") is True
+        assert await notifier.send_message("fail") is False
+    finally:
+        await notifier.aclose()
+
+    assert [(path, body["text"]) for path, body, _ in StubBotApi.requests] == [
+        ("/bottoken/sendMessage", "first"),
+        ("/bottoken/sendMessage", "second"),
+        ("/bottoken/sendMessage", "fail"),
+    ]
+    assert len({port for _, _, port in StubBotApi.requests}) == 1
+
+
+@pytest.mark.asyncio
+async def test_telegram_notifier_reports_unreachable_api():
+    notifier = TelegramNotifier(
+        TelegramSettings(bot_token="token", chat_id="-100", api_base_url="http://127.0.0.1:9", timeout_seconds=1.0)
+    )
+    assert await notifier.send_message("hello") is False
+    await notifier.aclose()
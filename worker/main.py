@@ -6,6 +6,7 @@ import time
 from typing import Any
 
 from aio_pika import Message, RobustChannel, connect_robust
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueueIterator
 
 from app.core.config import AppSettings, get_settings
 from app.core.logging import setup_logging
@@ -41,6 +42,9 @@ class NotificationWorker:
         self.notifier = TelegramNotifier(settings.telegram)
         self.channel: RobustChannel | None = None
         self._connection = None
+        self._queue_iter: AbstractQueueIterator | None = None
+        self._slots = asyncio.Semaphore(settings.rabbit.worker_concurrency)
+        self._in_flight: set[asyncio.Task[None]] = set()
 
     async def start(self) -> None:
         attempt = 1
@@ -54,21 +58,42 @@ class NotificationWorker:
                 await asyncio.sleep(min(5, attempt))
                 attempt += 1
         self._connection = connection
+        await self.notifier.start()
         self.channel = await connection.channel()
+        # Prefetch above the concurrency keeps the next messages local while handlers are busy.
+        await self.channel.set_qos(prefetch_count=self.settings.rabbit.prefetch_count)
         queue = await self.channel.declare_queue(self.settings.rabbit.notifications_queue, durable=True)
         logger.info("Worker started, waiting for messages")
         async with queue.iterator() as queue_iter:
+            self._queue_iter = queue_iter
             async for message in queue_iter:
-                async with message.process():
-                    await self._handle_message(message)
+                await self._slots.acquire()
+                task = asyncio.create_task(self._process(message))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
 
     async def close(self) -> None:
+        # Stop taking deliveries, let in-flight notifications finish; unacked prefetched messages are requeued.
+        if self._queue_iter:
+            await self._queue_iter.close()
+        if self._in_flight:
+            await asyncio.wait(self._in_flight, timeout=30)
+        await self.notifier.aclose()
         if self.channel:
             await self.channel.close()
         if self._connection:
             await self._connection.close()
 
-    async def _handle_message(self, message: Message) -> None:
+    async def _process(self, message: AbstractIncomingMessage) -> None:
+        try:
+            async with message.process():
+                await self._handle_message(message)
+        except Exception as exc:
+            logger.error("Failed to handle notification message: %s", exc)
+        finally:
+            self._slots.release()
+
+    async def _handle_message(self, message: AbstractIncomingMessage) -> None:
         attempt = int(message.headers.get("attempt", 1))
         event = message.headers.get("event", "unknown")
         payload: dict[str, Any] = json.loads(message.body.decode())
@@ -89,6 +114,17 @@ class NotificationWorker:
                 f"Новая запись {payload.get('appointment_id')} на слот {payload.get('slot_id')} "
                 f"к провайдеру {payload.get('provider_id')}"
             )
+        if event == "appointment.batch_created":
+            appointments = payload.get("appointments") or []
+            slots = ", ".join(str(item.get("slot_id")) for item in appointments)
+            return (
+                f"Новые записи ({len(appointments)}) к провайдеру {payload.get('provider_id')} "
+                f"на слоты {slots}"
+            )
+        if event == "appointment.batch_cancelled":
+            appointments = payload.get("appointments") or []
+            ids = ", ".join(str(item.get("appointment_id")) for item in appointments)
+            return f"Массовая отмена записей ({len(appointments)}): {ids}"
         if event == "appointment.cancelled":
             return f"Отмена записи {payload.get('appointment_id')} для слота {payload.get('slot_id')}"
         return f"Событие {event}: {payload}"